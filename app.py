@@ -12,10 +12,12 @@ import hmac
 import logging
 import math
 import os
+import re
 import sys
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+import orjson
 from flask import Flask, Response, jsonify
 from flask import request as flask_request
 from flask.json.provider import DefaultJSONProvider
@@ -45,6 +47,8 @@ from routes import (
     vectors_legacy_bp,
     virtual_channels_bp,
 )
+from utils.utils import get_hardware_info
+from utils.vv_error_codes import format_com_error
 from utils.vv_singleton import get_vv_instance, reset_vv_instance, set_vv_instance  # noqa: F401
 
 
@@ -61,11 +65,67 @@ def _sanitize_nan(value: Any) -> Any:
     return value
 
 
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_non_ascii(match: re.Match[str]) -> str:
+    """Return the JSON \\u escape for one character, as ``ensure_ascii`` writes it."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+
+
 class _NaNSafeJSONProvider(DefaultJSONProvider):
-    """JSON provider that converts NaN and Inf floats to null."""
+    """JSON provider that converts NaN and Inf floats to null.
+
+    Serialization uses orjson, which writes NaN and Inf as null natively, so
+    the payload does not need a sanitized copy. The standard library encoder
+    (with ``_sanitize_nan``) is used as a fallback for values orjson rejects,
+    such as integers wider than 64 bits. Non-ASCII characters in orjson's
+    output (e.g. unit strings like ``m/s²``) are escaped in place, so responses
+    stay ASCII-only as with ``ensure_ascii``.
+
+    Keys are emitted in the order the handlers build them and responses are
+    compact even when FLASK_DEBUG is set, so sorting and indentation are
+    never paid on the data endpoints.
+    """
+
+    sort_keys = False
+    compact = True
+
+    def _option(self) -> int:
+        # Datetimes go through the default hook so they keep Flask's HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def _encode(self, obj: Any, option: int, **kwargs: Any) -> bytes:
+        try:
+            data = orjson.dumps(obj, default=self.default, option=option)
+        except orjson.JSONEncodeError:
+            return super().dumps(_sanitize_nan(obj), **kwargs).encode("utf-8")
+        if self.ensure_ascii and not data.isascii():
+            # Non-ASCII can only occur inside JSON strings, so escaping each
+            # character of the encoded text gives what ensure_ascii would
+            data = _NON_ASCII.sub(_escape_non_ascii, data.decode("utf-8")).encode("ascii")
+        return data
 
     def dumps(self, obj: Any, **kwargs: Any) -> str:
-        return super().dumps(_sanitize_nan(obj), **kwargs)
+        if kwargs:
+            return super().dumps(_sanitize_nan(obj), **kwargs)
+        return self._encode(obj, self._option()).decode("utf-8")
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        option = self._option()
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            body = self._encode(obj, option | orjson.OPT_INDENT_2, indent=2)
+        else:
+            body = self._encode(obj, option, separators=(",", ":"))
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
 
 
 def create_app(config_class=Config) -> Flask:
@@ -160,6 +220,12 @@ def create_app(config_class=Config) -> Flask:
 
         register_write_guard(app)
 
+    # Compress large JSON responses for clients that accept gzip
+    if app.config.get("GZIP_MIN_SIZE", 0) > 0:
+        from utils.compression import register_compression
+
+        register_compression(app, app.config["GZIP_MIN_SIZE"])
+
     # Register blueprint modules directly under /api/v1/ (no module prefixes)
     app.register_blueprint(basic_control_bp, url_prefix="/api/v1")
     app.register_blueprint(status_properties_bp, url_prefix="/api/v1")
@@ -187,12 +253,8 @@ def create_app(config_class=Config) -> Flask:
         connection = {"success": False, "error": None}
         if vv is not None:
             try:
-                from utils.utils import get_hardware_info
-
                 connection = get_hardware_info(vv)
             except Exception as e:
-                from utils.vv_error_codes import format_com_error
-
                 connection.update(format_com_error(e))
 
         return jsonify(
@@ -244,13 +306,11 @@ def create_app(config_class=Config) -> Flask:
     @app.route("/api/v1/docs", methods=["GET"])
     def api_documentation() -> Response:
         """Get comprehensive API documentation"""
-        from flask import request
-
         docs = {
             "title": "VibrationVIEW REST API - Modular 1:1 Automation Interface",
             "version": app.config.get("API_VERSION", "1.0.0"),
             "description": "Exact 1:1 REST interface for VibrationVIEW COM automation methods",
-            "base_url": request.host_url + "api/v1",
+            "base_url": flask_request.host_url + "api/v1",
             "architecture": "Modular design with functional separation and singleton VibrationVIEW instance",
             "modules": {
                 "basic_control": "Core test control operations (StartTest, StopTest, etc.)",
@@ -270,21 +330,21 @@ def create_app(config_class=Config) -> Flask:
                 "log": "Event log retrieval",
             },
             "module_docs": {
-                "basic_control": request.host_url + "api/v1/docs/basic_control",
-                "status_properties": request.host_url + "api/v1/docs/status_properties",
-                "data_retrieval": request.host_url + "api/v1/docs/data_retrieval",
-                "advanced_control": request.host_url + "api/v1/docs/advanced_control",
-                "advanced_control_sine": request.host_url + "api/v1/docs/advanced_control_sine",
-                "advanced_control_system_check": request.host_url + "api/v1/docs/advanced_control_system_check",
-                "hardware_config": request.host_url + "api/v1/docs/hardware_config",
-                "input_config": request.host_url + "api/v1/docs/input_config",
-                "teds": request.host_url + "api/v1/docs/teds",
-                "recording": request.host_url + "api/v1/docs/recording",
-                "reporting": request.host_url + "api/v1/docs/reporting",
-                "auxinputs": request.host_url + "api/v1/docs/auxinputs",
-                "gui_control": request.host_url + "api/v1/docs/gui_control",
-                "virtual_channels": request.host_url + "api/v1/docs/virtual_channels",
-                "log": request.host_url + "api/v1/docs/log",
+                "basic_control": flask_request.host_url + "api/v1/docs/basic_control",
+                "status_properties": flask_request.host_url + "api/v1/docs/status_properties",
+                "data_retrieval": flask_request.host_url + "api/v1/docs/data_retrieval",
+                "advanced_control": flask_request.host_url + "api/v1/docs/advanced_control",
+                "advanced_control_sine": flask_request.host_url + "api/v1/docs/advanced_control_sine",
+                "advanced_control_system_check": flask_request.host_url + "api/v1/docs/advanced_control_system_check",
+                "hardware_config": flask_request.host_url + "api/v1/docs/hardware_config",
+                "input_config": flask_request.host_url + "api/v1/docs/input_config",
+                "teds": flask_request.host_url + "api/v1/docs/teds",
+                "recording": flask_request.host_url + "api/v1/docs/recording",
+                "reporting": flask_request.host_url + "api/v1/docs/reporting",
+                "auxinputs": flask_request.host_url + "api/v1/docs/auxinputs",
+                "gui_control": flask_request.host_url + "api/v1/docs/gui_control",
+                "virtual_channels": flask_request.host_url + "api/v1/docs/virtual_channels",
+                "log": flask_request.host_url + "api/v1/docs/log",
             },
         }
 
@@ -333,6 +393,9 @@ def create_app(config_class=Config) -> Flask:
             {"success": False, "error": "Internal server error", "message": "An unexpected error occurred"}
         ), 500
 
+    # Compile the URL matcher now rather than on the first request
+    app.url_map.update()
+
     # Try to connect at startup, but allow the app to start without VibrationVIEW.
     # The singleton will retry on each request via get_vv_instance().
     logger.info("Attempting VibrationVIEW connection...")
@@ -42,6 +42,10 @@ class Config:
     # they reach application code, preventing memory exhaustion from oversized uploads.
     MAX_CONTENT_LENGTH = int(os.environ.get("MAX_CONTENT_LENGTH") or 10 * 1024 * 1024)
 
+    # JSON responses of at least this many bytes are gzip-compressed for clients
+    # that send Accept-Encoding: gzip (e.g. large /vector arrays). Set to 0 to disable.
+    GZIP_MIN_SIZE = int(os.environ.get("GZIP_MIN_SIZE") or "1024")
+
     # Logging — VV_LOG_DIR is resolved to an absolute path so logs are
     # written to a predictable location regardless of the working directory.
     LOG_LEVEL = os.environ.get("LOG_LEVEL") or "INFO"
@@ -54,6 +58,15 @@ class Config:
     VV_RETRY_ATTEMPTS = int(os.environ.get("VV_RETRY_ATTEMPTS") or "5")
     VV_MAX_INSTANCES = int(os.environ.get("VV_MAX_INSTANCES") or "5")
 
+    # How long (seconds) a ListOpenTests() result may be reused. The cache is
+    # also cleared whenever this API opens or closes a test. Set to 0 to disable.
+    OPEN_TESTS_CACHE_TTL = float(os.environ.get("OPEN_TESTS_CACHE_TTL") or "0.5")
+
+    # Cache-Control max-age (seconds) for channel/control/vector label, unit and
+    # length lookups. Labels change when another test is loaded, so this is off
+    # by default. Set to e.g. 30 for dashboards that poll labels.
+    LABEL_CACHE_MAX_AGE = int(os.environ.get("LABEL_CACHE_MAX_AGE") or "0")
+
     # VibrationVIEW folders - configurable via environment variables
     VIBRATIONVIEW_FOLDER = os.environ.get("VIBRATIONVIEW_FOLDER") or "C:\\VibrationVIEW"
     PROFILE_FOLDER = os.environ.get("PROFILE_FOLDER") or os.path.join(VIBRATIONVIEW_FOLDER, "Profiles")
@@ -7,10 +7,8 @@ Basic Control Routes - 1:1 VibrationVIEW COM Interface Mapping
 Core test control operations matching exact COM method signatures
 """
 
-import logging
 import os
 from typing import Any
-from urllib.parse import unquote
 
 from flask import Blueprint, Response, jsonify, request
 
@@ -18,159 +16,171 @@ from config import Config
 from utils.decorators import handle_errors
 from utils.exceptions import APIError
 from utils.path_validator import PathValidationError, validate_file_path
-from utils.response_helpers import success_response
+from utils.response_helpers import StaticJSONDocument, success_response
 from utils.utils import (
     get_filename_from_request,
     get_hardware_info,
+    get_query_param_string,
     get_system_info,
     is_default_template_filename,
     process_file_upload,
 )
-from utils.vv_manager import with_vibrationview
+from utils.vv_manager import invalidate_open_tests_cache, list_open_tests_cached, with_vibrationview
 
 # Create blueprint
 basic_control_bp = Blueprint("basic_control", __name__)
 
-logger = logging.getLogger(__name__)
+# Column headers for the ListOpenTests() 2D array
+OPEN_TESTS_COLUMNS = (
+    "Tab Index",  # Column 0: 1-based tab index
+    "Test Type",  # Column 1: Test type label (Random, Sine, Shock, etc.)
+    "File Path",  # Column 2: Full file path
+    "Test Name",  # Column 3: Test name on tab
+)
 
 
-@basic_control_bp.route("/docs/basic_control", methods=["GET"])
-def get_documentation() -> Response:
-    """Get basic control module documentation"""
-    docs = {
-        "module": "basic_control",
-        "description": "1:1 mapping of VibrationVIEW COM basic control methods",
-        "com_object": "VibrationVIEW.Application",
-        "endpoints": {
-            "POST|PUT /starttest": {
-                "description": "Start currently loaded VibrationVIEW test",
-                "com_method": "StartTest()",
-                "parameters": "None",
-                "returns": "Result from StartTest()",
-                "example": "POST /api/v1/starttest or PUT /api/v1/starttest",
-            },
-            "POST|PUT /runtest": {
-                "description": "Upload and run a test file, OR run existing test by path",
-                "com_method": "RunTest(filepath)",
-                "modes": {
-                    "With file content (upload mode)": {
-                        "Option 1 (multipart/form-data)": "any file field (filename auto-detected)",
-                        "Option 2 (raw binary)": "filename query param + binary body",
-                    },
-                    "Without file content": {
-                        "filename": "string - Query parameter with test filename",
-                        "OR unnamed parameter": "string - Test filename as first URL parameter",
-                    },
-                },
-                "returns": "object - Status, test running verification, file path",
-                "examples": [
-                    "POST /api/v1/runtest with multipart/form-data (upload + run)",
-                    "POST /api/v1/runtest?filename=test.vsp with raw binary body (upload + run)",
-                    "POST /api/v1/runtest?filename=test.vsp (run existing file)",
-                ],
-            },
-            "POST|PUT /stoptest": {
-                "description": "Stop currently running test",
-                "com_method": "StopTest()",
-                "parameters": "None",
-                "returns": "Result from StopTest()",
-                "example": "POST /api/v1/stoptest or PUT /api/v1/stoptest",
-            },
-            "POST|PUT /resumetest": {
-                "description": "Resume paused test",
-                "com_method": "ResumeTest()",
-                "parameters": "None",
-                "returns": "Result from ResumeTest()",
-                "example": "POST /api/v1/resumetest or PUT /api/v1/resumetest",
-            },
-            "POST|PUT /opentest": {
-                "description": "Upload and open a test file, OR open existing test by path",
-                "com_method": "OpenTest(filepath)",
-                "modes": {
-                    "With file content (upload mode)": {
-                        "Option 1 (multipart/form-data)": "any file field (filename auto-detected)",
-                        "Option 2 (raw binary)": "filename query param + binary body",
-                    },
-                    "Without file content": {
-                        "filename": "string - Query parameter with test filename",
-                        "OR unnamed parameter": "string - Test filename as first URL parameter",
-                    },
+# Module documentation is static, so it is built and serialized once at import
+DOCS = {
+    "module": "basic_control",
+    "description": "1:1 mapping of VibrationVIEW COM basic control methods",
+    "com_object": "VibrationVIEW.Application",
+    "endpoints": {
+        "POST|PUT /starttest": {
+            "description": "Start currently loaded VibrationVIEW test",
+            "com_method": "StartTest()",
+            "parameters": "None",
+            "returns": "Result from StartTest()",
+            "example": "POST /api/v1/starttest or PUT /api/v1/starttest",
+        },
+        "POST|PUT /runtest": {
+            "description": "Upload and run a test file, OR run existing test by path",
+            "com_method": "RunTest(filepath)",
+            "modes": {
+                "With file content (upload mode)": {
+                    "Option 1 (multipart/form-data)": "any file field (filename auto-detected)",
+                    "Option 2 (raw binary)": "filename query param + binary body (Content-Length or chunked)",
                 },
-                "returns": "object - Status, file path",
-                "examples": [
-                    "POST /api/v1/opentest with multipart/form-data (upload + open)",
-                    "POST /api/v1/opentest?filename=test.vsp with raw binary body (upload + open)",
-                    "POST /api/v1/opentest?filename=test.vsp (open existing file)",
-                ],
-            },
-            "POST /closetest": {
-                "description": "Close test profile by name",
-                "com_method": "CloseTest(profile_name)",
-                "parameters": {
-                    "profilename": "string - Query parameter with profile name (named parameter)",
-                    "OR unnamed parameter": "string - Profile name as first URL parameter",
+                "Without file content": {
+                    "filename": "string - Query parameter with test filename",
+                    "OR unnamed parameter": "string - Test filename as first URL parameter",
                 },
-                "returns": "boolean - test_was_closed status",
-                "example": "POST /api/v1/closetest?profilename=test1.vsp",
             },
-            "POST /closetab": {
-                "description": "Close test tab by index",
-                "com_method": "CloseTab(tab_index)",
-                "parameters": {
-                    "tabindex": "integer - Query parameter with tab index (0-based, named parameter)",
-                    "OR unnamed parameter": "integer - Tab index as first URL parameter",
+            "returns": "object - Status, test running verification, file path",
+            "examples": [
+                "POST /api/v1/runtest with multipart/form-data (upload + run)",
+                "POST /api/v1/runtest?filename=test.vsp with raw binary body (upload + run)",
+                "POST /api/v1/runtest?filename=test.vsp (run existing file)",
+            ],
+        },
+        "POST|PUT /stoptest": {
+            "description": "Stop currently running test",
+            "com_method": "StopTest()",
+            "parameters": "None",
+            "returns": "Result from StopTest()",
+            "example": "POST /api/v1/stoptest or PUT /api/v1/stoptest",
+        },
+        "POST|PUT /resumetest": {
+            "description": "Resume paused test",
+            "com_method": "ResumeTest()",
+            "parameters": "None",
+            "returns": "Result from ResumeTest()",
+            "example": "POST /api/v1/resumetest or PUT /api/v1/resumetest",
+        },
+        "POST|PUT /opentest": {
+            "description": "Upload and open a test file, OR open existing test by path",
+            "com_method": "OpenTest(filepath)",
+            "modes": {
+                "With file content (upload mode)": {
+                    "Option 1 (multipart/form-data)": "any file field (filename auto-detected)",
+                    "Option 2 (raw binary)": "filename query param + binary body (Content-Length or chunked)",
                 },
-                "returns": "boolean - test_was_closed status (200 on success, 405 if tab could not be closed)",
-                "status_codes": {
-                    "200": "Success - tab was closed",
-                    "400": "Missing or invalid tab index parameter",
-                    "405": "Tab could not be closed (may not exist or may be running a test)",
+                "Without file content": {
+                    "filename": "string - Query parameter with test filename",
+                    "OR unnamed parameter": "string - Test filename as first URL parameter",
                 },
-                "example": "POST /api/v1/closetab?tabindex=0 or POST /api/v1/closetab?tabindex=1",
             },
-            "GET /listopentests": {
-                "description": "List all open test profiles with detailed information",
-                "com_method": "ListOpenTests()",
-                "parameters": "None",
-                "returns": {
-                    "open_tests": "2D array - Each row contains [Tab Index, Test Type, File Path, Test Name]",
-                    "columns": 'array - Column headers ["Tab Index", "Test Type", "File Path", "Test Name"]',
-                    "count": "integer - Number of open tests",
-                },
-                "column_structure": [
-                    'Column 0: Tab index (1-based string, e.g., "1", "2", "3")',
-                    'Column 1: Test type label (e.g., "Random", "Sine", "Shock")',
-                    "Column 2: Full file path of the test profile",
-                    "Column 3: Test name (displayed on tabs)",
-                ],
-                "example": "GET /api/v1/listopentests",
+            "returns": "object - Status, file path",
+            "examples": [
+                "POST /api/v1/opentest with multipart/form-data (upload + open)",
+                "POST /api/v1/opentest?filename=test.vsp with raw binary body (upload + open)",
+                "POST /api/v1/opentest?filename=test.vsp (open existing file)",
+            ],
+        },
+        "POST /closetest": {
+            "description": "Close test profile by name",
+            "com_method": "CloseTest(profile_name)",
+            "parameters": {
+                "profilename": "string - Query parameter with profile name (named parameter)",
+                "OR unnamed parameter": "string - Profile name as first URL parameter",
             },
-            "POST /savedata": {
-                "description": "Save current test data to file",
-                "com_method": "SaveData(filename)",
-                "parameters": {
-                    "filename": "string - Filename or full path to save data to (named parameter). If only filename is provided, DATA_FOLDER is used as default path."
-                },
-                "returns": "Success status with saved file path",
-                "examples": [
-                    "POST /api/v1/savedata?filename=savefile.vsd (saves to DATA_FOLDER)",
-                    "POST /api/v1/savedata?filename=C:\\Custom\\Path\\savefile.vsd (saves to custom path)",
-                ],
+            "returns": "boolean - test_was_closed status",
+            "example": "POST /api/v1/closetest?profilename=test1.vsp",
+        },
+        "POST /closetab": {
+            "description": "Close test tab by index",
+            "com_method": "CloseTab(tab_index)",
+            "parameters": {
+                "tabindex": "integer - Query parameter with tab index (0-based, named parameter)",
+                "OR unnamed parameter": "integer - Tab index as first URL parameter",
+            },
+            "returns": "boolean - test_was_closed status (200 on success, 405 if tab could not be closed)",
+            "status_codes": {
+                "200": "Success - tab was closed",
+                "400": "Missing or invalid tab index parameter",
+                "405": "Tab could not be closed (may not exist or may be running a test)",
             },
+            "example": "POST /api/v1/closetab?tabindex=0 or POST /api/v1/closetab?tabindex=1",
         },
-        "notes": [
-            "All endpoints are 1:1 COM method mappings unless explicitly noted as composite operations",
-            "If COM method raises exception, it will be caught and returned as error",
-            "StartTest requires a test to be previously loaded with OpenTest",
-            "File paths should use full absolute paths",
-            "COM interface uses 0-based indexing for all arrays",
-            "PUT endpoints accept binary file uploads up to 10MB",
-            "All endpoints support both named parameters (e.g., testname=file.vsp) and unnamed parameters (e.g., file.vsp)",
-            "Query strings are URL-decoded to handle special characters in filenames",
-            "GET and POST methods behave identically for all endpoints that support both",
-        ],
-    }
-    return jsonify(docs)
+        "GET /listopentests": {
+            "description": "List all open test profiles with detailed information",
+            "com_method": "ListOpenTests()",
+            "parameters": "None",
+            "returns": {
+                "open_tests": "2D array - Each row contains [Tab Index, Test Type, File Path, Test Name]",
+                "columns": 'array - Column headers ["Tab Index", "Test Type", "File Path", "Test Name"]',
+                "count": "integer - Number of open tests",
+            },
+            "column_structure": [
+                'Column 0: Tab index (1-based string, e.g., "1", "2", "3")',
+                'Column 1: Test type label (e.g., "Random", "Sine", "Shock")',
+                "Column 2: Full file path of the test profile",
+                "Column 3: Test name (displayed on tabs)",
+            ],
+            "example": "GET /api/v1/listopentests",
+        },
+        "POST /savedata": {
+            "description": "Save current test data to file",
+            "com_method": "SaveData(filename)",
+            "parameters": {
+                "filename": "string - Filename or full path to save data to (named parameter). If only filename is provided, DATA_FOLDER is used as default path."
+            },
+            "returns": "Success status with saved file path",
+            "examples": [
+                "POST /api/v1/savedata?filename=savefile.vsd (saves to DATA_FOLDER)",
+                "POST /api/v1/savedata?filename=C:\\Custom\\Path\\savefile.vsd (saves to custom path)",
+            ],
+        },
+    },
+    "notes": [
+        "All endpoints are 1:1 COM method mappings unless explicitly noted as composite operations",
+        "If COM method raises exception, it will be caught and returned as error",
+        "StartTest requires a test to be previously loaded with OpenTest",
+        "File paths should use full absolute paths",
+        "COM interface uses 0-based indexing for all arrays",
+        "PUT endpoints accept binary file uploads up to 10MB",
+        "Raw binary uploads may be sent with Transfer-Encoding: chunked when the size is not known up front",
+        "All endpoints support both named parameters (e.g., testname=file.vsp) and unnamed parameters (e.g., file.vsp)",
+        "Query strings are URL-decoded to handle special characters in filenames",
+        "GET and POST methods behave identically for all endpoints that support both",
+    ],
+}
+_DOCS_DOCUMENT = StaticJSONDocument(DOCS)
+
+
+@basic_control_bp.route("/docs/basic_control", methods=["GET"])
+def get_documentation() -> Response:
+    """Get basic control module documentation"""
+    return _DOCS_DOCUMENT.response()
 
 
 @basic_control_bp.route("/starttest", methods=["GET", "POST", "PUT"])
@@ -229,6 +239,7 @@ def run_test(vv_instance: Any) -> Response:
         if file_path:
             assert filename is not None
             vv_instance.RunTest(file_path)
+            invalidate_open_tests_cache()
             result = vv_instance.IsRunning()
 
             return jsonify(
@@ -245,6 +256,7 @@ def run_test(vv_instance: Any) -> Response:
         raise APIError("Missing required query parameter: filename", "MISSING_PARAMETER")
 
     vv_instance.RunTest(filename)
+    invalidate_open_tests_cache()
     result = vv_instance.IsRunning()
 
     return jsonify(success_response({"result": result, "filepath": filename}, f"RunTest command executed: {filename}"))
@@ -330,17 +342,20 @@ def open_test(vv_instance: Any) -> Response:
                     )
                 )
 
-            # Close any existing test with the same name to avoid conflicts
+            # Close any existing test with the same name to avoid conflicts. Read
+            # the tabs live: CloseTab() takes an index, and tabs closed in the
+            # VibrationVIEW UI would make a cached index point at another test.
             existing_tests = vv_instance.ListOpenTests()
             if existing_tests:
                 basename_lower = os.path.splitext(os.path.basename(filename))[0].lower()
-                for test in existing_tests:
-                    test_name = test[3].lower() if test[3] else ""
-                    if basename_lower == test_name:
-                        vv_instance.CloseTab(int(test[0]))
+                match = next((test for test in existing_tests if (test[3] or "").lower() == basename_lower), None)
+                if match is not None:
+                    vv_instance.CloseTab(int(match[0]))
+                    invalidate_open_tests_cache()
 
             # Open the uploaded test file
             vv_instance.OpenTest(file_path)
+            invalidate_open_tests_cache()
 
             return jsonify(
                 success_response(
@@ -356,6 +371,7 @@ def open_test(vv_instance: Any) -> Response:
         raise APIError("Missing required query parameter: filename", "MISSING_PARAMETER")
 
     vv_instance.OpenTest(filename)
+    invalidate_open_tests_cache()
 
     return jsonify(success_response({"result": True, "filepath": filename}, f"OpenTest command executed: {filename}"))
 
@@ -380,14 +396,7 @@ def close_test(vv_instance: Any) -> Response:
     Example: GET /api/v1/closetest?profilename=test1.vsp or POST /api/v1/closetest?test1.vsp
     """
     # Get profile name from parameters - check named parameter first, then unnamed
-    profile_name = request.args.get("profilename")
-
-    # If no 'profilename' parameter, try to get the first unnamed parameter
-    if profile_name is None:
-        query_string = request.query_string.decode("utf-8")
-        if query_string:
-            # URL decode the query string to handle special characters
-            profile_name = unquote(query_string)
+    profile_name = get_query_param_string("profilename")
 
     if not profile_name:
         raise APIError(
@@ -396,6 +405,7 @@ def close_test(vv_instance: Any) -> Response:
 
     # Call CloseTest method
     test_was_closed = vv_instance.CloseTest(profile_name)
+    invalidate_open_tests_cache()
 
     return jsonify(
         success_response(
@@ -428,14 +438,7 @@ def close_tab(vv_instance: Any) -> Response:
              GET /api/v1/closetab?0 or POST /api/v1/closetab?2 (unnamed parameter)
     """
     # Get tab index from parameters - check named parameter first, then unnamed
-    tab_index_str = request.args.get("tabindex")
-
-    # If no 'tabindex' parameter, try to get the first unnamed parameter
-    if tab_index_str is None:
-        query_string = request.query_string.decode("utf-8")
-        if query_string:
-            # URL decode the query string to handle special characters
-            tab_index_str = unquote(query_string)
+    tab_index_str = get_query_param_string("tabindex")
 
     if not tab_index_str:
         raise APIError(
@@ -449,6 +452,7 @@ def close_tab(vv_instance: Any) -> Response:
 
     # Call CloseTab method
     test_was_closed = vv_instance.CloseTab(tab_index)
+    invalidate_open_tests_cache()
 
     # Return 405 if the tab was not closed
     if not test_was_closed:
@@ -487,27 +491,16 @@ def list_open_tests(vv_instance: Any) -> Response:
 
     Example: GET /api/v1/listopentests
     """
-    # Call ListOpenTests method
-    open_tests = vv_instance.ListOpenTests()
-
-    # Convert to list if it's a tuple or other iterable
-    if open_tests is not None:
-        open_tests_list = list(open_tests)
-    else:
-        open_tests_list = []
-
-    # Column headers for the data structure
-    column_headers = [
-        "Tab Index",  # Column 0: 1-based tab index
-        "Test Type",  # Column 1: Test type label (Random, Sine, Shock, etc.)
-        "File Path",  # Column 2: Full file path
-        "Test Name",  # Column 3: Test name on tab
-    ]
+    # ListOpenTests returns a tuple of row tuples (or None when nothing is open);
+    # the JSON provider serializes tuples directly, so no list copy is made.
+    # Polling clients share the short-lived cache that open/close/run invalidate.
+    open_tests = list_open_tests_cached(vv_instance) or ()
+    count = len(open_tests)
 
     return jsonify(
         success_response(
-            {"open_tests": open_tests_list, "columns": column_headers, "count": len(open_tests_list)},
-            f"ListOpenTests command executed: {len(open_tests_list)} test(s) open",
+            {"open_tests": open_tests, "columns": OPEN_TESTS_COLUMNS, "count": count},
+            f"ListOpenTests command executed: {count} test(s) open",
         )
     )
 
@@ -535,8 +528,8 @@ def save_data(vv_instance: Any) -> Response:
     if not filename:
         raise APIError("Missing required query parameter: filename", "MISSING_PARAMETER")
 
-    # If filename has no path separators, prepend DATA_FOLDER
-    if not os.path.dirname(filename):
+    # If filename has no path separators or drive, prepend DATA_FOLDER
+    if "/" not in filename and "\\" not in filename and ":" not in filename:
         file_path = os.path.join(Config.DATA_FOLDER, filename)
     else:
         file_path = filename
@@ -18,14 +18,14 @@ Note: Vector data retrieval has been moved to vectors_legacy.py
 
 import logging
 import os
-from typing import Any
+from typing import Any, Optional
 
 from flask import Blueprint, Response, jsonify, request, send_file
 
 from utils.decorators import handle_errors
 from utils.exceptions import APIError
 from utils.path_validator import PathValidationError, validate_file_path
-from utils.response_helpers import success_response
+from utils.response_helpers import StaticJSONDocument, cacheable_response, success_response
 from utils.utils import convert_channel_to_com_index, get_last_data_file
 from utils.vv_manager import with_vibrationview
 
@@ -39,95 +39,106 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
-@data_retrieval_bp.route("/docs/data_retrieval", methods=["GET"])
-def get_documentation() -> Response:
-    """Get data retrieval module documentation"""
-    docs = {
-        "module": "data_retrieval",
-        "description": "1:1 mapping of VibrationVIEW COM data retrieval methods",
-        "com_object": "VibrationVIEW.Application",
-        "endpoints": {
-            "Primary Data Arrays": {
-                "GET /demand": {
-                    "description": "Get demand values for all loops",
-                    "com_method": "Demand()",
-                    "parameters": "None",
-                    "returns": "List[float] - Demand values for each output loop",
-                },
-                "GET /control": {
-                    "description": "Get control values for all loops",
-                    "com_method": "Control()",
-                    "parameters": "None",
-                    "returns": "List[float] - Control values for each output loop",
-                },
-                "GET /channel": {
-                    "description": "Get channel values for all channels",
-                    "com_method": "Channel()",
-                    "parameters": "None",
-                    "returns": "List[float] - Channel values for all input channels",
-                },
-                "GET /output": {
-                    "description": "Get output values for all loops",
-                    "com_method": "Output()",
-                    "parameters": "None",
-                    "returns": "List[float] - Output values for each output loop",
-                },
+# Module documentation is static, so it is built and serialized once at import
+DOCS = {
+    "module": "data_retrieval",
+    "description": "1:1 mapping of VibrationVIEW COM data retrieval methods",
+    "com_object": "VibrationVIEW.Application",
+    "endpoints": {
+        "Primary Data Arrays": {
+            "GET /demand": {
+                "description": "Get demand values for all loops",
+                "com_method": "Demand()",
+                "parameters": "None",
+                "returns": "List[float] - Demand values for each output loop",
+            },
+            "GET /control": {
+                "description": "Get control values for all loops",
+                "com_method": "Control()",
+                "parameters": "None",
+                "returns": "List[float] - Control values for each output loop",
             },
-            "Channel Metadata (1-based indexing)": {
-                "GET /channelunit": {
-                    "description": "Get channel units",
-                    "com_method": "ChannelUnit(channelnum - 1)",
-                    "parameters": {
-                        "channelnum": "integer - Channel number (1-based, converted to 0-based internally, query parameter)"
-                    },
-                    "returns": "str - Units for the channel",
-                    "example": "GET /api/v1/channelunit?channelnum=3",
+            "GET /channel": {
+                "description": "Get channel values for all channels",
+                "com_method": "Channel()",
+                "parameters": "None",
+                "returns": "List[float] - Channel values for all input channels",
+            },
+            "GET /output": {
+                "description": "Get output values for all loops",
+                "com_method": "Output()",
+                "parameters": "None",
+                "returns": "List[float] - Output values for each output loop",
+            },
+            "GET /snapshot": {
+                "description": "Get demand, control, channel and output values in one request",
+                "com_method": "Demand(), Control(), Channel(), Output()",
+                "parameters": "None",
+                "returns": "Dict - demand, control, channel and output arrays as returned by the individual endpoints",
+            },
+        },
+        "Channel Metadata (1-based indexing)": {
+            "GET /channelunit": {
+                "description": "Get channel units",
+                "com_method": "ChannelUnit(channelnum - 1)",
+                "parameters": {
+                    "channelnum": "integer - Channel number (1-based, converted to 0-based internally, query parameter)"
                 },
-                "GET /channellabel": {
-                    "description": "Get channel label",
-                    "com_method": "ChannelLabel(channelnum - 1)",
-                    "parameters": {
-                        "channelnum": "integer - Channel number (1-based, converted to 0-based internally, query parameter)"
-                    },
-                    "returns": "str - Label for the channel",
-                    "example": "GET /api/v1/channellabel?channelnum=1",
+                "returns": "str - Units for the channel",
+                "example": "GET /api/v1/channelunit?channelnum=3",
+            },
+            "GET /channellabel": {
+                "description": "Get channel label",
+                "com_method": "ChannelLabel(channelnum - 1)",
+                "parameters": {
+                    "channelnum": "integer - Channel number (1-based, converted to 0-based internally, query parameter)"
                 },
+                "returns": "str - Label for the channel",
+                "example": "GET /api/v1/channellabel?channelnum=1",
             },
-            "Control Metadata (1-based indexing)": {
-                "GET /controlunit": {
-                    "description": "Get control loop units",
-                    "com_method": "ControlUnit(loopnum - 1)",
-                    "parameters": {
-                        "loopnum": "integer - Loop number (1-based, converted to 0-based internally, query parameter, defaults to 1)"
-                    },
-                    "returns": "str - Units for the control loop",
-                    "example": "GET /api/v1/controlunit (defaults to loop 1) or GET /api/v1/controlunit?loopnum=2",
+        },
+        "Control Metadata (1-based indexing)": {
+            "GET /controlunit": {
+                "description": "Get control loop units",
+                "com_method": "ControlUnit(loopnum - 1)",
+                "parameters": {
+                    "loopnum": "integer - Loop number (1-based, converted to 0-based internally, query parameter, defaults to 1)"
                 },
-                "GET /controllabel": {
-                    "description": "Get control loop label",
-                    "com_method": "ControlLabel(loopnum - 1)",
-                    "parameters": {
-                        "loopnum": "integer - Loop number (1-based, converted to 0-based internally, query parameter, defaults to 1)"
-                    },
-                    "returns": "str - Label for the control loop",
-                    "example": "GET /api/v1/controllabel (defaults to loop 1) or GET /api/v1/controllabel?loopnum=2",
+                "returns": "str - Units for the control loop",
+                "example": "GET /api/v1/controlunit (defaults to loop 1) or GET /api/v1/controlunit?loopnum=2",
+            },
+            "GET /controllabel": {
+                "description": "Get control loop label",
+                "com_method": "ControlLabel(loopnum - 1)",
+                "parameters": {
+                    "loopnum": "integer - Loop number (1-based, converted to 0-based internally, query parameter, defaults to 1)"
                 },
+                "returns": "str - Label for the control loop",
+                "example": "GET /api/v1/controllabel (defaults to loop 1) or GET /api/v1/controllabel?loopnum=2",
             },
         },
-        "indexing_notes": {
-            "channel_parameters": "Channel and loop parameters use 1-based indexing for user convenience",
-            "internal_conversion": "API automatically converts 1-based input to 0-based for VibrationVIEW COM interface",
-            "validation": "Channel/loop numbers must be >= 1, will return error for 0 or negative values",
-        },
-        "notes": [
-            "All methods return real-time data from VibrationVIEW",
-            "Array sizes depend on hardware configuration",
-            "Channel arrays based on input channel count",
-            "Control/Demand/Output arrays based on output loop count",
-            "Channel and loop parameters use 1-based indexing and are converted internally",
-        ],
-    }
-    return jsonify(docs)
+    },
+    "indexing_notes": {
+        "channel_parameters": "Channel and loop parameters use 1-based indexing for user convenience",
+        "internal_conversion": "API automatically converts 1-based input to 0-based for VibrationVIEW COM interface",
+        "validation": "Channel/loop numbers must be >= 1, will return error for 0 or negative values",
+    },
+    "notes": [
+        "All methods return real-time data from VibrationVIEW",
+        "Array sizes depend on hardware configuration",
+        "Channel arrays based on input channel count",
+        "Control/Demand/Output arrays based on output loop count",
+        "Channel and loop parameters use 1-based indexing and are converted internally",
+        "Label and unit responses carry Cache-Control: private, max-age=LABEL_CACHE_MAX_AGE when that setting is > 0",
+    ],
+}
+_DOCS_DOCUMENT = StaticJSONDocument(DOCS)
+
+
+@data_retrieval_bp.route("/docs/data_retrieval", methods=["GET"])
+def get_documentation() -> Response:
+    """Get data retrieval module documentation"""
+    return _DOCS_DOCUMENT.response()
 
 
 # ============================================================================
@@ -200,11 +211,58 @@ def output(vv_instance: Any) -> Response:
     return jsonify(success_response({"result": result}, f"Retrieved {len(result)} output values"))
 
 
+@data_retrieval_bp.route("/snapshot", methods=["GET"])
+@handle_errors
+@with_vibrationview
+def snapshot(vv_instance: Any) -> Response:
+    """
+    Get all primary data arrays in one request
+
+    COM Methods: Demand(), Control(), Channel(), Output()
+    Combines the four primary array endpoints so polling clients need a single
+    HTTP round trip per sample instead of four.
+
+    Example: GET /api/v1/snapshot
+    """
+    results = {
+        "demand": vv_instance.Demand(),
+        "control": vv_instance.Control(),
+        "channel": vv_instance.Channel(),
+        "output": vv_instance.Output(),
+    }
+
+    return jsonify(success_response(results, "Retrieved demand, control, channel and output values"))
+
+
 # ============================================================================
 # CHANNEL METADATA (1-based indexing with conversion)
 # ============================================================================
 
 
+def _get_index_param(name: str) -> Optional[str]:
+    """Return the named parameter, else the first bare key (e.g. ``?3``), else None"""
+    value = request.args.get(name)
+    if value is None:
+        value = next(iter(request.args), None)
+    return value
+
+
+def _get_loopnum() -> int:
+    """Parse the 1-based loop number from the query string, defaulting to loop 1"""
+    loopnum_raw = _get_index_param("loopnum")
+    if loopnum_raw is None:
+        return 1
+
+    try:
+        loopnum = int(loopnum_raw)
+    except ValueError:
+        raise APIError("loopnum must be an integer", "INVALID_PARAMETER")
+
+    if loopnum < 1:
+        raise APIError(f"loopnum must be >= 1 (1-based indexing), got {loopnum}", "INVALID_PARAMETER")
+    return loopnum
+
+
 @data_retrieval_bp.route("/channelunit", methods=["GET"])
 @handle_errors
 @with_vibrationview
@@ -221,19 +279,15 @@ def channel_unit(vv_instance: Any) -> Response:
     Example:
         GET /api/v1/channelunit?3
     """
-    # Get channelnum from named parameter or first positional key
-    if not request.args:
-        raise APIError("Missing required query parameter: channelnum", "MISSING_PARAMETER")
-
-    channelnum_raw = request.args.get("channelnum")
+    channelnum_raw = _get_index_param("channelnum")
     if channelnum_raw is None:
-        channelnum_raw = list(request.args.keys())[0]
+        raise APIError("Missing required query parameter: channelnum", "MISSING_PARAMETER")
 
     channel_com = convert_channel_to_com_index(channelnum_raw)
 
     result = vv_instance.ChannelUnit(channel_com)
 
-    return jsonify(
+    return cacheable_response(
         success_response({"result": result, "channelnum": int(channelnum_raw), "internal_channelnum": channel_com})
     )
 
@@ -254,19 +308,15 @@ def channel_label(vv_instance: Any) -> Response:
     Example:
         GET /api/v1/channellabel?1
     """
-    # Get channelnum from named parameter or first positional key
-    if not request.args:
-        raise APIError("Missing required query parameter: channelnum", "MISSING_PARAMETER")
-
-    channelnum_raw = request.args.get("channelnum")
+    channelnum_raw = _get_index_param("channelnum")
     if channelnum_raw is None:
-        channelnum_raw = list(request.args.keys())[0]
+        raise APIError("Missing required query parameter: channelnum", "MISSING_PARAMETER")
 
     channel_com = convert_channel_to_com_index(channelnum_raw)
 
     result = vv_instance.ChannelLabel(channel_com)
 
-    return jsonify(
+    return cacheable_response(
         success_response({"result": result, "channelnum": int(channelnum_raw), "internal_channelnum": channel_com})
     )
 
@@ -294,29 +344,11 @@ def control_unit(vv_instance: Any) -> Response:
         GET /api/v1/controlunit?loopnum=2
         GET /api/v1/controlunit?2
     """
-    # Determine loop number - default to 1 if no parameters
-    loopnum: int = 1
-    if request.args:
-        try:
-            # Try to get 'loopnum' parameter first, then fall back to first key
-            loopnum_param = request.args.get("loopnum", type=int)
-            if loopnum_param is not None:
-                loopnum = loopnum_param
-            else:
-                # If no 'loopnum' parameter, try the first key as the value
-                first_key = list(request.args.keys())[0]
-                loopnum = int(first_key)
-        except (ValueError, IndexError):
-            raise APIError("loopnum must be an integer", "INVALID_PARAMETER")
-
-    # Convert from 1-based to 0-based
-    if loopnum < 1:
-        raise APIError(f"loopnum must be >= 1 (1-based indexing), got {loopnum}", "INVALID_PARAMETER")
-
+    loopnum = _get_loopnum()
     loop_num_0based = loopnum - 1
 
     result = vv_instance.ControlUnit(loop_num_0based)
-    return jsonify(
+    return cacheable_response(
         success_response(
             {
                 "result": result,
@@ -345,29 +377,11 @@ def control_label(vv_instance: Any) -> Response:
         GET /api/v1/controllabel?loopnum=2
         GET /api/v1/controllabel?2
     """
-    # Determine loop number - default to 1 if no parameters
-    loopnum: int = 1
-    if request.args:
-        try:
-            # Try to get 'loopnum' parameter first, then fall back to first key
-            loopnum_param = request.args.get("loopnum", type=int)
-            if loopnum_param is not None:
-                loopnum = loopnum_param
-            else:
-                # If no 'loopnum' parameter, try the first key as the value
-                first_key = list(request.args.keys())[0]
-                loopnum = int(first_key)
-        except (ValueError, IndexError):
-            raise APIError("loopnum must be an integer", "INVALID_PARAMETER")
-
-    # Convert from 1-based to 0-based
-    if loopnum < 1:
-        raise APIError(f"loopnum must be >= 1 (1-based indexing), got {loopnum}", "INVALID_PARAMETER")
-
+    loopnum = _get_loopnum()
     loop_num_0based = loopnum - 1
 
     result = vv_instance.ControlLabel(loop_num_0based)
-    return jsonify(
+    return cacheable_response(
         success_response(
             {"result": result, "loopnum": loopnum, "internal_loopnum": loop_num_0based},
             f"ControlLabel retrieved for loop {loopnum}: {result}",
@@ -400,12 +414,9 @@ def get_data_file(vv_instance: Any) -> Response:
              GET /api/v1/getdatafile?file_path=specific_file.vrd
              POST /api/v1/getdatafile with JSON body: {"file_path": "specific_file.vrd"}
     """
-    # Get parameters from JSON body (optional) or query parameters
-    try:
-        request_data = request.get_json() or {}
-    except Exception:
-        # If JSON parsing fails, use empty dict and fall back to query parameters
-        request_data = {}
+    # Get parameters from JSON body (optional) or query parameters; a missing or
+    # unparseable body falls back to the query parameters
+    request_data = request.get_json(silent=True) or {}
 
     file_path = request_data.get("file_path") or request.args.get("file_path")
 
@@ -419,14 +430,12 @@ def get_data_file(vv_instance: Any) -> Response:
     except PathValidationError as e:
         raise APIError(str(e), "PATH_VALIDATION_ERROR", 403)
 
-    if not os.path.exists(validated_file_path):
+    # Return raw file as binary download; send_file stats the file itself, so a
+    # missing file is detected there rather than with a separate exists() check
+    file_name = os.path.basename(validated_file_path)
+    try:
+        return send_file(
+            validated_file_path, as_attachment=True, download_name=file_name, mimetype="application/octet-stream"
+        )
+    except FileNotFoundError:
         raise APIError(f"File not found: {validated_file_path}", "FILE_NOT_FOUND", 404)
-
-    # Use validated path
-    file_path = validated_file_path
-
-    # Get file info
-    file_name = os.path.basename(file_path)
-
-    # Return raw file as binary download
-    return send_file(file_path, as_attachment=True, download_name=file_name, mimetype="application/octet-stream")
@@ -8,14 +8,15 @@ GUI and window management operations matching exact COM method signatures
 """
 
 import logging
-from typing import Any
+from typing import Any, Dict, List, Tuple
 
 from flask import Blueprint, Response, jsonify, request
 
 from utils.decorators import handle_errors
 from utils.exceptions import APIError
-from utils.response_helpers import success_response
+from utils.response_helpers import StaticJSONDocument, error_response, success_response
 from utils.utils import get_filename_from_request, process_file_upload
+from utils.vv_error_codes import classify_vview_error, format_com_error, get_scode_from_exception
 from utils.vv_manager import with_vibrationview
 
 # Create blueprint
@@ -24,72 +25,89 @@ gui_control_bp = Blueprint("gui_control", __name__)
 logger = logging.getLogger(__name__)
 
 
-@gui_control_bp.route("/docs/gui_control", methods=["GET"])
-def get_documentation() -> Response:
-    """Get GUI control module documentation"""
-    docs = {
-        "module": "gui_control",
-        "description": "1:1 mapping of VibrationVIEW COM GUI control methods",
-        "com_object": "VibrationVIEW.Application",
-        "endpoints": {
-            "Test Editing": {
-                "POST|PUT /edittest": {
-                    "description": "Upload and edit test file, OR edit existing by path",
-                    "com_method": "EditTest(szTestName)",
-                    "modes": {
-                        "With file content (upload)": "multipart/form-data or raw binary + filename param",
-                        "Without file content": "filename query parameter to edit existing",
-                    },
-                    "returns": "Success status with file path",
-                    "examples": [
-                        "POST /api/v1/edittest with multipart/form-data (upload + edit)",
-                        "PUT /api/v1/edittest?filename=test.vsp with binary body",
-                        "POST /api/v1/edittest?filename=test.vsp (edit existing)",
-                    ],
-                },
-                "POST /abortedit": {
-                    "description": "Abort any open Edit session",
-                    "com_method": "AbortEdit()",
-                    "parameters": "None",
-                    "returns": "HRESULT - Success status from COM method",
+# Module documentation is static, so it is built and serialized once at import
+DOCS = {
+    "module": "gui_control",
+    "description": "1:1 mapping of VibrationVIEW COM GUI control methods",
+    "com_object": "VibrationVIEW.Application",
+    "endpoints": {
+        "Test Editing": {
+            "POST|PUT /edittest": {
+                "description": "Upload and edit test file, OR edit existing by path",
+                "com_method": "EditTest(szTestName)",
+                "modes": {
+                    "With file content (upload)": "multipart/form-data or raw binary + filename param",
+                    "Without file content": "filename query parameter to edit existing",
                 },
+                "returns": "Success status with file path",
+                "examples": [
+                    "POST /api/v1/edittest with multipart/form-data (upload + edit)",
+                    "PUT /api/v1/edittest?filename=test.vsp with binary body",
+                    "POST /api/v1/edittest?filename=test.vsp (edit existing)",
+                ],
             },
-            "Window Management": {
-                "POST /minimize": {
-                    "description": "Minimize VibrationVIEW",
-                    "com_method": "Minimize()",
-                    "parameters": "None",
-                    "returns": "HRESULT - Success status from COM method",
-                },
-                "POST /restore": {
-                    "description": "Restore VibrationVIEW",
-                    "com_method": "Restore()",
-                    "parameters": "None",
-                    "returns": "HRESULT - Success status from COM method",
-                },
-                "POST /maximize": {
-                    "description": "Maximize VibrationVIEW",
-                    "com_method": "Maximize()",
-                    "parameters": "None",
-                    "returns": "HRESULT - Success status from COM method",
-                },
-                "POST /activate": {
-                    "description": "Activate VibrationVIEW",
-                    "com_method": "Activate()",
-                    "parameters": "None",
-                    "returns": "HRESULT - Success status from COM method",
+            "POST /abortedit": {
+                "description": "Abort any open Edit session",
+                "com_method": "AbortEdit()",
+                "parameters": "None",
+                "returns": "HRESULT - Success status from COM method",
+            },
+        },
+        "Window Management": {
+            "POST /minimize": {
+                "description": "Minimize VibrationVIEW",
+                "com_method": "Minimize()",
+                "parameters": "None",
+                "returns": "HRESULT - Success status from COM method",
+            },
+            "POST /restore": {
+                "description": "Restore VibrationVIEW",
+                "com_method": "Restore()",
+                "parameters": "None",
+                "returns": "HRESULT - Success status from COM method",
+            },
+            "POST /maximize": {
+                "description": "Maximize VibrationVIEW",
+                "com_method": "Maximize()",
+                "parameters": "None",
+                "returns": "HRESULT - Success status from COM method",
+            },
+            "POST /activate": {
+                "description": "Activate VibrationVIEW",
+                "com_method": "Activate()",
+                "parameters": "None",
+                "returns": "HRESULT - Success status from COM method",
+            },
+        },
+        "Batch": {
+            "POST /batch": {
+                "description": "Run several GUI commands in order in one request",
+                "com_method": "Minimize(), Restore(), Maximize(), Activate(), AbortEdit(), EditTest(szTestName)",
+                "parameters": {
+                    "calls": 'List of {"method": name, "args": [...]} - args only for EditTest (test file name)',
                 },
+                "returns": "List of per-call results; stops at the first failing call and returns an error response with the results so far in error.details",
+                "examples": [
+                    'POST /api/v1/batch with {"calls": [{"method": "EditTest", "args": ["test.vsp"]}, {"method": "Maximize"}]}'
+                ],
             },
         },
-        "notes": [
-            "POST/PUT requests with parameters use URL query strings",
-            "All methods return HRESULT status codes",
-            "EditTest requires valid test file name",
-            "Window management methods affect VibrationVIEW main window",
-            "COM interface uses 0-based indexing for all arrays",
-        ],
-    }
-    return jsonify(docs)
+    },
+    "notes": [
+        "POST/PUT requests with parameters use URL query strings",
+        "All methods return HRESULT status codes",
+        "EditTest requires valid test file name",
+        "Window management methods affect VibrationVIEW main window",
+        "COM interface uses 0-based indexing for all arrays",
+    ],
+}
+_DOCS_DOCUMENT = StaticJSONDocument(DOCS)
+
+
+@gui_control_bp.route("/docs/gui_control", methods=["GET"])
+def get_documentation() -> Response:
+    """Get GUI control module documentation"""
+    return _DOCS_DOCUMENT.response()
 
 
 # Test Editing Control
@@ -229,3 +247,93 @@ def activate(vv_instance: Any) -> Response:
     result = True  # If no exception, assume success
 
     return jsonify(success_response({"result": result}, "Activate command executed"))
+
+
+# Batched GUI commands: COM method name -> number of string arguments
+BATCH_METHODS = {
+    "Minimize": 0,
+    "Restore": 0,
+    "Maximize": 0,
+    "Activate": 0,
+    "AbortEdit": 0,
+    "EditTest": 1,
+}
+MAX_BATCH_CALLS = 32
+
+
+def _parse_batch_calls(data: Any) -> List[Tuple[str, List[str]]]:
+    """Validate a /batch body and return (method, args) pairs"""
+    calls = data.get("calls") if isinstance(data, dict) else None
+    if not isinstance(calls, list) or not calls:
+        raise APIError("Request body must contain a non-empty 'calls' list", "MISSING_PARAMETER")
+    if len(calls) > MAX_BATCH_CALLS:
+        raise APIError(f"At most {MAX_BATCH_CALLS} calls per batch, got {len(calls)}", "INVALID_PARAMETER")
+
+    parsed = []
+    for index, call in enumerate(calls):
+        method = call.get("method") if isinstance(call, dict) else None
+        if method not in BATCH_METHODS:
+            raise APIError(
+                f"calls[{index}]: method must be one of {', '.join(BATCH_METHODS)}, got {method!r}",
+                "INVALID_PARAMETER",
+            )
+        args = call.get("args", [])
+        if (
+            not isinstance(args, list)
+            or len(args) != BATCH_METHODS[method]
+            or not all(isinstance(arg, str) and arg for arg in args)
+        ):
+            raise APIError(
+                f"calls[{index}]: {method} takes {BATCH_METHODS[method]} string argument(s)", "INVALID_PARAMETER"
+            )
+        parsed.append((method, args))
+    return parsed
+
+
+@gui_control_bp.route("/batch", methods=["POST"])
+@handle_errors
+@with_vibrationview
+def batch(vv_instance: Any) -> Response:
+    """
+    Run several GUI commands in one request
+
+    COM Methods: Minimize(), Restore(), Maximize(), Activate(), AbortEdit(), EditTest(szTestName)
+    Calls are made in order. The whole list is validated before any call is
+    made, and execution stops at the first call that raises. A failed batch
+    returns an error response whose details hold the per-call results so far.
+
+    POST JSON Body:
+        calls: list of {"method": name, "args": [...]}
+
+    Example:
+        POST /api/v1/batch
+        Body: {"calls": [{"method": "EditTest", "args": ["test1.vsp"]}, {"method": "Maximize"}]}
+    """
+    calls = _parse_batch_calls(request.get_json(silent=True))
+
+    results: List[Dict[str, Any]] = []
+    for index, (method, args) in enumerate(calls):
+        try:
+            result = getattr(vv_instance, method)(*args)
+        except Exception as e:
+            logger.error("Batch call %s failed: %s", method, e)
+            failure = format_com_error(e)
+            results.append({"method": method, "success": False, **failure})
+            scode = get_scode_from_exception(e)
+            http_status = classify_vview_error(scode)[0] if scode is not None else 500
+            return jsonify(
+                error_response(
+                    f"Batch stopped at calls[{index}] ({method}): {failure['error']}",
+                    failure.get("error_code", "COM_ERROR"),
+                    details={"results": results, "completed": False},
+                )
+            ), http_status
+        # Window commands return nothing; no exception means success
+        results.append({"method": method, "success": True, "result": True if result is None else result})
+
+    return jsonify(
+        success_response(
+            {"results": results, "completed": True},
+            f"Batch executed: {len(calls)} calls",
+        )
+    )
@@ -8,15 +8,15 @@ Hardware and input configuration operations matching exact COM method signatures
 """
 
 import logging
-from typing import Any
+from typing import Any, Tuple
 
 from flask import Blueprint, Response, jsonify, request
 
 from utils.decorators import handle_errors
 from utils.exceptions import APIError
-from utils.response_helpers import success_response
+from utils.response_helpers import StaticJSONDocument, success_response
 from utils.utils import convert_channel_to_com_index
-from utils.vv_manager import with_vibrationview
+from utils.vv_manager import software_version_cached, with_vibrationview
 
 # Create blueprint
 hardware_config_bp = Blueprint("hardware_config", __name__)
@@ -24,71 +24,75 @@ hardware_config_bp = Blueprint("hardware_config", __name__)
 logger = logging.getLogger(__name__)
 
 
-@hardware_config_bp.route("/docs/hardware_config", methods=["GET"])
-def get_documentation() -> Response:
-    """Get hardware configuration module documentation"""
-    docs = {
-        "module": "hardware_config",
-        "description": "1:1 mapping of VibrationVIEW COM hardware configuration methods",
-        "com_object": "VibrationVIEW.Application",
-        "endpoints": {
-            "Hardware Information": {
-                "GET /gethardwareinputchannels": {
-                    "description": "Get number of hardware input channels",
-                    "com_method": "GetHardwareInputChannels()",
-                    "parameters": "None",
-                    "returns": "int - Number of input channels",
-                },
-                "GET /gethardwareoutputchannels": {
-                    "description": "Get number of hardware output channels",
-                    "com_method": "GetHardwareOutputChannels()",
-                    "parameters": "None",
-                    "returns": "int - Number of output channels",
-                },
-                "GET /gethardwareserialnumber": {
-                    "description": "Get hardware serial number",
-                    "com_method": "GetHardwareSerialNumber()",
-                    "parameters": "None",
-                    "returns": "str - Hardware serial number",
-                },
-                "GET /getsoftwareversion": {
-                    "description": "Get software version",
-                    "com_method": "GetSoftwareVersion()",
-                    "parameters": "None",
-                    "returns": "str - Software version",
-                },
+# Module documentation is static, so it is built and serialized once at import
+DOCS = {
+    "module": "hardware_config",
+    "description": "1:1 mapping of VibrationVIEW COM hardware configuration methods",
+    "com_object": "VibrationVIEW.Application",
+    "endpoints": {
+        "Hardware Information": {
+            "GET /gethardwareinputchannels": {
+                "description": "Get number of hardware input channels",
+                "com_method": "GetHardwareInputChannels()",
+                "parameters": "None",
+                "returns": "int - Number of input channels",
+            },
+            "GET /gethardwareoutputchannels": {
+                "description": "Get number of hardware output channels",
+                "com_method": "GetHardwareOutputChannels()",
+                "parameters": "None",
+                "returns": "int - Number of output channels",
+            },
+            "GET /gethardwareserialnumber": {
+                "description": "Get hardware serial number",
+                "com_method": "GetHardwareSerialNumber()",
+                "parameters": "None",
+                "returns": "str - Hardware serial number",
+            },
+            "GET /getsoftwareversion": {
+                "description": "Get software version",
+                "com_method": "GetSoftwareVersion()",
+                "parameters": "None",
+                "returns": "str - Software version",
             },
-            "Hardware Capability Checks": {
-                "POST /hardwaresupportscapacitorcoupled": {
-                    "description": "Check if hardware supports capacitor coupled",
-                    "com_method": "HardwareSupportsCapacitorCoupled(channel)",
-                    "parameters": {"channel": "int - Input channel number"},
-                    "returns": "bool - Support status",
-                },
-                "POST /hardwaresupportsaccelpowersource": {
-                    "description": "Check if hardware supports accelerometer power source",
-                    "com_method": "HardwareSupportsAccelPowerSource(channel)",
-                    "parameters": {"channel": "int - Input channel number"},
-                    "returns": "bool - Support status",
-                },
-                "POST /hardwaresupportsdifferential": {
-                    "description": "Check if hardware supports differential",
-                    "com_method": "HardwareSupportsDifferential(channel)",
-                    "parameters": {"channel": "int - Input channel number"},
-                    "returns": "bool - Support status",
-                },
+        },
+        "Hardware Capability Checks": {
+            "POST /hardwaresupportscapacitorcoupled": {
+                "description": "Check if hardware supports capacitor coupled",
+                "com_method": "HardwareSupportsCapacitorCoupled(channel)",
+                "parameters": {"channel": "int - Input channel number"},
+                "returns": "bool - Support status",
+            },
+            "POST /hardwaresupportsaccelpowersource": {
+                "description": "Check if hardware supports accelerometer power source",
+                "com_method": "HardwareSupportsAccelPowerSource(channel)",
+                "parameters": {"channel": "int - Input channel number"},
+                "returns": "bool - Support status",
+            },
+            "POST /hardwaresupportsdifferential": {
+                "description": "Check if hardware supports differential",
+                "com_method": "HardwareSupportsDifferential(channel)",
+                "parameters": {"channel": "int - Input channel number"},
+                "returns": "bool - Support status",
             },
         },
-        "notes": [
-            "GET requests return current parameter value for get/set endpoints",
-            "POST requests with JSON body parameters perform operations",
-            "Channel numbers are 1-based (first channel is 1)",
-            "Hardware capability checks help determine available features",
-            "COM interface uses 0-based indexing internally; the API converts automatically",
-            "Input-specific endpoints moved to input_config module: /api/v1/docs/input_config",
-        ],
-    }
-    return jsonify(docs)
+    },
+    "notes": [
+        "GET requests return current parameter value for get/set endpoints",
+        "POST requests with JSON body parameters perform operations",
+        "Channel numbers are 1-based (first channel is 1)",
+        "Hardware capability checks help determine available features",
+        "COM interface uses 0-based indexing internally; the API converts automatically",
+        "Input-specific endpoints moved to input_config module: /api/v1/docs/input_config",
+    ],
+}
+_DOCS_DOCUMENT = StaticJSONDocument(DOCS)
+
+
+@hardware_config_bp.route("/docs/hardware_config", methods=["GET"])
+def get_documentation() -> Response:
+    """Get hardware configuration module documentation"""
+    return _DOCS_DOCUMENT.response()
 
 
 # Hardware Information
@@ -145,14 +149,25 @@ def get_software_version(vv_instance: Any) -> Response:
     Get Software Version
 
     COM Method: GetSoftwareVersion()
-    Returns the version of the VibrationVIEW software.
+    Returns the version of the VibrationVIEW software. The value is read once
+    per VibrationVIEW connection, since it cannot change while running.
     """
-    result = vv_instance.GetSoftwareVersion()
+    result = software_version_cached(vv_instance)
 
     return jsonify(success_response({"result": result}, f"Software version: {result}"))
 
 
 # Hardware Capability Checks
+def _get_channel() -> Tuple[int, int]:
+    """Return (channel, 0-based COM channel) from the first query parameter (e.g. ``?1``)"""
+    channel_raw = next(iter(request.args), None)
+    if channel_raw is None:
+        raise APIError("Missing required query parameter: channel", "MISSING_PARAMETER")
+
+    channel_com = convert_channel_to_com_index(channel_raw)
+    return channel_com + 1, channel_com
+
+
 @hardware_config_bp.route("/hardwaresupportscapacitorcoupled", methods=["GET"])
 @handle_errors
 @with_vibrationview
@@ -168,19 +183,14 @@ def hardware_supports_capacitor_coupled(vv_instance: Any) -> Response:
 
     Example: GET /api/v1/hardwaresupportscapacitorcoupled?1
     """
-    # Get channel from query parameters (first parameter after ?)
-    query_args = list(request.args.keys())
-    if not query_args:
-        raise APIError("Missing required query parameter: channel", "MISSING_PARAMETER")
-
-    channel_com = convert_channel_to_com_index(query_args[0])
+    channel, channel_com = _get_channel()
 
     result = vv_instance.HardwareSupportsCapacitorCoupled(channel_com)
 
     return jsonify(
         success_response(
-            {"result": result, "channel": int(query_args[0]), "internal_channel": channel_com},
-            f"Channel {query_args[0]} capacitor coupled support: {result}",
+            {"result": result, "channel": channel, "internal_channel": channel_com},
+            f"Channel {channel} capacitor coupled support: {result}",
         )
     )
 
@@ -200,19 +210,14 @@ def hardware_supports_accel_power_source(vv_instance: Any) -> Response:
 
     Example: GET /api/v1/hardwaresupportsaccelpowersource?1
     """
-    # Get channel from query parameters (first parameter after ?)
-    query_args = list(request.args.keys())
-    if not query_args:
-        raise APIError("Missing required query parameter: channel", "MISSING_PARAMETER")
-
-    channel_com = convert_channel_to_com_index(query_args[0])
+    channel, channel_com = _get_channel()
 
     result = vv_instance.HardwareSupportsAccelPowerSource(channel_com)
 
     return jsonify(
         success_response(
-            {"result": result, "channel": int(query_args[0]), "internal_channel": channel_com},
-            f"Channel {query_args[0]} accel power source support: {result}",
+            {"result": result, "channel": channel, "internal_channel": channel_com},
+            f"Channel {channel} accel power source support: {result}",
         )
     )
 
@@ -232,18 +237,13 @@ def hardware_supports_differential(vv_instance: Any) -> Response:
 
     Example: GET /api/v1/hardwaresupportsdifferential?1
     """
-    # Get channel from query parameters (first parameter after ?)
-    query_args = list(request.args.keys())
-    if not query_args:
-        raise APIError("Missing required query parameter: channel", "MISSING_PARAMETER")
-
-    channel_com = convert_channel_to_com_index(query_args[0])
+    channel, channel_com = _get_channel()
 
     result = vv_instance.HardwareSupportsDifferential(channel_com)
 
     return jsonify(
         success_response(
-            {"result": result, "channel": int(query_args[0]), "internal_channel": channel_com},
-            f"Channel {query_args[0]} differential support: {result}",
+            {"result": result, "channel": channel, "internal_channel": channel_com},
+            f"Channel {channel} differential support: {result}",
         )
     )
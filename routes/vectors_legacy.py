@@ -15,13 +15,16 @@ Includes:
 """
 
 import logging
-from typing import Any
+import struct
+import sys
+from array import array
+from typing import Any, Sequence
 
 from flask import Blueprint, Response, jsonify, request
 
 from utils.decorators import handle_errors
 from utils.exceptions import APIError
-from utils.response_helpers import success_response
+from utils.response_helpers import StaticJSONDocument, cacheable_response, success_response
 from utils.vv_manager import with_vibrationview
 
 # Create blueprint
@@ -34,178 +37,258 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
-@vectors_legacy_bp.route("/docs/vectors_legacy", methods=["GET"])
-def get_documentation() -> Response:
-    """Get vectors_legacy module documentation"""
-    docs = {
-        "module": "vectors_legacy",
-        "description": "Legacy vector data retrieval methods (superseded by ReportVector in VibrationVIEW 2025.3+)",
-        "com_object": "VibrationVIEW.Application",
-        "deprecation_notice": "These methods are superseded by ReportVector in VibrationVIEW 2025.3 and later. Consider using /api/v1/reportvector instead.",
-        "endpoints": {
-            "GET /vector": {
-                "description": "Get raw data vector",
-                "com_method": "Vector(vectorenum, columns)",
-                "parameters": {
-                    "vectorenum": "integer - Vector enumeration identifier (required)",
-                    "columns": "integer - Number of columns (optional, default: 1)",
-                },
-                "returns": "List[List[float]] - Raw data vector array",
-            },
-            "GET /vectorunit": {
-                "description": "Get vector units",
-                "com_method": "VectorUnit(vectorenum)",
-                "parameters": {"vectorenum": "integer - Vector enumeration identifier"},
-                "returns": "str - Units for the vector",
-            },
-            "GET /vectorlabel": {
-                "description": "Get vector label",
-                "com_method": "VectorLabel(vectorenum)",
-                "parameters": {"vectorenum": "integer - Vector enumeration identifier"},
-                "returns": "str - Label for the vector",
+# Module documentation is static, so it is built and serialized once at import
+DOCS = {
+    "module": "vectors_legacy",
+    "description": "Legacy vector data retrieval methods (superseded by ReportVector in VibrationVIEW 2025.3+)",
+    "com_object": "VibrationVIEW.Application",
+    "deprecation_notice": "These methods are superseded by ReportVector in VibrationVIEW 2025.3 and later. Consider using /api/v1/reportvector instead.",
+    "endpoints": {
+        "GET /vector": {
+            "description": "Get raw data vector",
+            "com_method": "Vector(vectorenum, columns)",
+            "parameters": {
+                "vectorenum": "integer - Vector enumeration identifier (required)",
+                "columns": "integer - Number of columns (optional, default: 1)",
+                "format": "string - 'bin' for a binary response (optional, default: JSON)",
             },
-            "GET /vectorlength": {
-                "description": "Get vector array length",
-                "com_method": "VectorLength(vectorenum)",
-                "parameters": {"vectorenum": "integer - Vector enumeration identifier"},
-                "returns": "int - Required array length for the vector",
-            },
-            "GET /docs/vector_enums": {
-                "description": "Get complete vector enumeration reference",
-                "parameters": "None",
-                "returns": "Complete enumeration mappings for waveform, frequency, and time history vectors",
+            "returns": "List[List[float]] - Raw data vector array",
+            "binary_format": (
+                "With format=bin or Accept: application/octet-stream the body is application/octet-stream: "
+                "an 8-byte header of two little-endian uint32 values (rows, points per row) followed by "
+                "rows * points little-endian float64 values in row order"
+            ),
+        },
+        "HEAD /vector": {
+            "description": "Get the size of a raw data vector without transferring it",
+            "com_method": "VectorLength(vectorenum)",
+            "parameters": {"vectorenum": "Same query parameters as GET /vector"},
+            "returns": "Headers only - X-Vector-Rows, X-Vector-Points and, for format=bin, Content-Length",
+        },
+        "GET|POST /vectors": {
+            "description": "Get several raw data vectors in one request",
+            "com_method": "Vector(vectorenum, columns) for each enumeration",
+            "parameters": {
+                "enums": "Comma-separated integers (GET) or list of integers (POST body) - Vector enumerations, at most 32 distinct",
+                "columns": "integer - Number of columns for every vector (optional, default: 1)",
             },
+            "returns": "Dict[str, List[List[float]]] - Vector data keyed by enumeration",
+        },
+        "GET /vectorunit": {
+            "description": "Get vector units",
+            "com_method": "VectorUnit(vectorenum)",
+            "parameters": {"vectorenum": "integer - Vector enumeration identifier"},
+            "returns": "str - Units for the vector",
+        },
+        "GET /vectorlabel": {
+            "description": "Get vector label",
+            "com_method": "VectorLabel(vectorenum)",
+            "parameters": {"vectorenum": "integer - Vector enumeration identifier"},
+            "returns": "str - Label for the vector",
         },
-        "notes": [
-            "Vector enumerations are passed as-is (no conversion needed)",
-            "Arrays use 0-based indexing internally but returned in order (channel 1 = index 0, etc.)",
-            "Use /docs/vector_enums for complete enumeration reference",
-            "Vector methods are superseded by ReportVector in VibrationVIEW 2025.4 and later",
-            "Consider migrating to ReportVector for new implementations",
-        ],
-    }
-    return jsonify(docs)
+        "GET /vectorlength": {
+            "description": "Get vector array length",
+            "com_method": "VectorLength(vectorenum)",
+            "parameters": {"vectorenum": "integer - Vector enumeration identifier"},
+            "returns": "int - Required array length for the vector",
+        },
+        "GET /docs/vector_enums": {
+            "description": "Get complete vector enumeration reference",
+            "parameters": "None",
+            "returns": "Complete enumeration mappings for waveform, frequency, and time history vectors",
+        },
+    },
+    "notes": [
+        "Vector enumerations are passed as-is (no conversion needed)",
+        "Arrays use 0-based indexing internally but returned in order (channel 1 = index 0, etc.)",
+        "Use /docs/vector_enums for complete enumeration reference",
+        "Vector methods are superseded by ReportVector in VibrationVIEW 2025.4 and later",
+        "Consider migrating to ReportVector for new implementations",
+        "Label, unit and length responses carry Cache-Control: private, max-age=LABEL_CACHE_MAX_AGE when that setting is > 0",
+    ],
+}
+_DOCS_DOCUMENT = StaticJSONDocument(DOCS)
+
+
+@vectors_legacy_bp.route("/docs/vectors_legacy", methods=["GET"])
+def get_documentation() -> Response:
+    """Get vectors_legacy module documentation"""
+    return _DOCS_DOCUMENT.response()
 
 
 # fmt: off
-@vectors_legacy_bp.route("/docs/vector_enums", methods=["GET"])
-def get_vector_enumerations() -> Response:
-    """Get complete vector enumeration reference"""
-    enums = {
-        "module": "vector_enumerations",
-        "description": "Complete VibrationVIEW vector enumeration reference for Vector() method",
-        "waveform_enums": {
-            "VV_WAVEFORMAXIS": 0,
-            "VV_WAVEFORM1": 1, "VV_WAVEFORM2": 2, "VV_WAVEFORM3": 3, "VV_WAVEFORM4": 4,
-            "VV_WAVEFORM5": 5, "VV_WAVEFORM6": 6, "VV_WAVEFORM7": 7, "VV_WAVEFORM8": 8,
-            "VV_WAVEFORM9": 9, "VV_WAVEFORM10": 10, "VV_WAVEFORM11": 11, "VV_WAVEFORM12": 12,
-            "VV_WAVEFORM13": 13, "VV_WAVEFORM14": 14, "VV_WAVEFORM15": 15, "VV_WAVEFORM16": 16,
-            "VV_WAVEFORM17": 17, "VV_WAVEFORM18": 18, "VV_WAVEFORM19": 19, "VV_WAVEFORM20": 20,
-            "VV_WAVEFORM21": 21, "VV_WAVEFORM22": 22, "VV_WAVEFORM23": 23, "VV_WAVEFORM24": 24,
-            "VV_WAVEFORM25": 25, "VV_WAVEFORM26": 26, "VV_WAVEFORM27": 27, "VV_WAVEFORM28": 28,
-            "VV_WAVEFORM29": 29, "VV_WAVEFORM30": 30, "VV_WAVEFORM31": 31, "VV_WAVEFORM32": 32,
-            "VV_WAVEFORM33": 33, "VV_WAVEFORM34": 34, "VV_WAVEFORM35": 35, "VV_WAVEFORM36": 36,
-            "VV_WAVEFORM37": 37, "VV_WAVEFORM38": 38, "VV_WAVEFORM39": 39, "VV_WAVEFORM40": 40,
-            "VV_WAVEFORM41": 41, "VV_WAVEFORM42": 42, "VV_WAVEFORM43": 43, "VV_WAVEFORM44": 44,
-            "VV_WAVEFORM45": 45, "VV_WAVEFORM46": 46, "VV_WAVEFORM47": 47, "VV_WAVEFORM48": 48,
-            "VV_WAVEFORM49": 49, "VV_WAVEFORM50": 50, "VV_WAVEFORM51": 51, "VV_WAVEFORM52": 52,
-            "VV_WAVEFORM53": 53, "VV_WAVEFORM54": 54, "VV_WAVEFORM55": 55, "VV_WAVEFORM56": 56,
-            "VV_WAVEFORM57": 57, "VV_WAVEFORM58": 58, "VV_WAVEFORM59": 59, "VV_WAVEFORM60": 60,
-            "VV_WAVEFORM61": 61, "VV_WAVEFORM62": 62, "VV_WAVEFORM63": 63, "VV_WAVEFORM64": 64,
-            "VV_WAVEFORMDEMAND": 90, "VV_WAVEFORMCONTROL": 91,
-            "VV_WAVEFORMDEMAND2": 92, "VV_WAVEFORMCONTROL2": 93,
-            "VV_WAVEFORMDEMAND3": 94, "VV_WAVEFORMCONTROL3": 95,
-            "VV_WAVEFORMDEMAND4": 96, "VV_WAVEFORMCONTROL4": 97
-        },
-        "frequency_enums": {
-            "VV_FREQUENCYAXIS": 100,
-            "VV_FREQUENCY1": 101, "VV_FREQUENCY2": 102, "VV_FREQUENCY3": 103, "VV_FREQUENCY4": 104,
-            "VV_FREQUENCY5": 105, "VV_FREQUENCY6": 106, "VV_FREQUENCY7": 107, "VV_FREQUENCY8": 108,
-            "VV_FREQUENCY9": 109, "VV_FREQUENCY10": 110, "VV_FREQUENCY11": 111, "VV_FREQUENCY12": 112,
-            "VV_FREQUENCY13": 113, "VV_FREQUENCY14": 114, "VV_FREQUENCY15": 115, "VV_FREQUENCY16": 116,
-            "VV_FREQUENCY17": 117, "VV_FREQUENCY18": 118, "VV_FREQUENCY19": 119, "VV_FREQUENCY20": 120,
-            "VV_FREQUENCY21": 121, "VV_FREQUENCY22": 122, "VV_FREQUENCY23": 123, "VV_FREQUENCY24": 124,
-            "VV_FREQUENCY25": 125, "VV_FREQUENCY26": 126, "VV_FREQUENCY27": 127, "VV_FREQUENCY28": 128,
-            "VV_FREQUENCY29": 129, "VV_FREQUENCY30": 130, "VV_FREQUENCY31": 131, "VV_FREQUENCY32": 132,
-            "VV_FREQUENCY33": 133, "VV_FREQUENCY34": 134, "VV_FREQUENCY35": 135, "VV_FREQUENCY36": 136,
-            "VV_FREQUENCY37": 137, "VV_FREQUENCY38": 138, "VV_FREQUENCY39": 139, "VV_FREQUENCY40": 140,
-            "VV_FREQUENCY41": 141, "VV_FREQUENCY42": 142, "VV_FREQUENCY43": 143, "VV_FREQUENCY44": 144,
-            "VV_FREQUENCY45": 145, "VV_FREQUENCY46": 146, "VV_FREQUENCY47": 147, "VV_FREQUENCY48": 148,
-            "VV_FREQUENCY49": 149, "VV_FREQUENCY50": 150, "VV_FREQUENCY51": 151, "VV_FREQUENCY52": 152,
-            "VV_FREQUENCY53": 153, "VV_FREQUENCY54": 154, "VV_FREQUENCY55": 155, "VV_FREQUENCY56": 156,
-            "VV_FREQUENCY57": 157, "VV_FREQUENCY58": 158, "VV_FREQUENCY59": 159, "VV_FREQUENCY60": 160,
-            "VV_FREQUENCY61": 161, "VV_FREQUENCY62": 162, "VV_FREQUENCY63": 163, "VV_FREQUENCY64": 164,
-            "VV_FREQUENCYDRIVE": 180, "VV_FREQUENCYRESPONSE": 181,
-            "VV_FREQUENCYDRIVE2": 182, "VV_FREQUENCYRESPONSE2": 183,
-            "VV_FREQUENCYDRIVE3": 184, "VV_FREQUENCYRESPONSE3": 185,
-            "VV_FREQUENCYDRIVE4": 186, "VV_FREQUENCYRESPONSE4": 187,
-            "VV_FREQUENCYDEMAND": 190, "VV_FREQUENCYCONTROL": 191,
-            "VV_FREQUENCYDEMAND2": 192, "VV_FREQUENCYCONTROL2": 193,
-            "VV_FREQUENCYDEMAND3": 194, "VV_FREQUENCYCONTROL3": 195,
-            "VV_FREQUENCYDEMAND4": 196, "VV_FREQUENCYCONTROL4": 197
+VECTOR_ENUMS = {
+    "module": "vector_enumerations",
+    "description": "Complete VibrationVIEW vector enumeration reference for Vector() method",
+    "waveform_enums": {
+        "VV_WAVEFORMAXIS": 0,
+        "VV_WAVEFORM1": 1, "VV_WAVEFORM2": 2, "VV_WAVEFORM3": 3, "VV_WAVEFORM4": 4,
+        "VV_WAVEFORM5": 5, "VV_WAVEFORM6": 6, "VV_WAVEFORM7": 7, "VV_WAVEFORM8": 8,
+        "VV_WAVEFORM9": 9, "VV_WAVEFORM10": 10, "VV_WAVEFORM11": 11, "VV_WAVEFORM12": 12,
+        "VV_WAVEFORM13": 13, "VV_WAVEFORM14": 14, "VV_WAVEFORM15": 15, "VV_WAVEFORM16": 16,
+        "VV_WAVEFORM17": 17, "VV_WAVEFORM18": 18, "VV_WAVEFORM19": 19, "VV_WAVEFORM20": 20,
+        "VV_WAVEFORM21": 21, "VV_WAVEFORM22": 22, "VV_WAVEFORM23": 23, "VV_WAVEFORM24": 24,
+        "VV_WAVEFORM25": 25, "VV_WAVEFORM26": 26, "VV_WAVEFORM27": 27, "VV_WAVEFORM28": 28,
+        "VV_WAVEFORM29": 29, "VV_WAVEFORM30": 30, "VV_WAVEFORM31": 31, "VV_WAVEFORM32": 32,
+        "VV_WAVEFORM33": 33, "VV_WAVEFORM34": 34, "VV_WAVEFORM35": 35, "VV_WAVEFORM36": 36,
+        "VV_WAVEFORM37": 37, "VV_WAVEFORM38": 38, "VV_WAVEFORM39": 39, "VV_WAVEFORM40": 40,
+        "VV_WAVEFORM41": 41, "VV_WAVEFORM42": 42, "VV_WAVEFORM43": 43, "VV_WAVEFORM44": 44,
+        "VV_WAVEFORM45": 45, "VV_WAVEFORM46": 46, "VV_WAVEFORM47": 47, "VV_WAVEFORM48": 48,
+        "VV_WAVEFORM49": 49, "VV_WAVEFORM50": 50, "VV_WAVEFORM51": 51, "VV_WAVEFORM52": 52,
+        "VV_WAVEFORM53": 53, "VV_WAVEFORM54": 54, "VV_WAVEFORM55": 55, "VV_WAVEFORM56": 56,
+        "VV_WAVEFORM57": 57, "VV_WAVEFORM58": 58, "VV_WAVEFORM59": 59, "VV_WAVEFORM60": 60,
+        "VV_WAVEFORM61": 61, "VV_WAVEFORM62": 62, "VV_WAVEFORM63": 63, "VV_WAVEFORM64": 64,
+        "VV_WAVEFORMDEMAND": 90, "VV_WAVEFORMCONTROL": 91,
+        "VV_WAVEFORMDEMAND2": 92, "VV_WAVEFORMCONTROL2": 93,
+        "VV_WAVEFORMDEMAND3": 94, "VV_WAVEFORMCONTROL3": 95,
+        "VV_WAVEFORMDEMAND4": 96, "VV_WAVEFORMCONTROL4": 97
+    },
+    "frequency_enums": {
+        "VV_FREQUENCYAXIS": 100,
+        "VV_FREQUENCY1": 101, "VV_FREQUENCY2": 102, "VV_FREQUENCY3": 103, "VV_FREQUENCY4": 104,
+        "VV_FREQUENCY5": 105, "VV_FREQUENCY6": 106, "VV_FREQUENCY7": 107, "VV_FREQUENCY8": 108,
+        "VV_FREQUENCY9": 109, "VV_FREQUENCY10": 110, "VV_FREQUENCY11": 111, "VV_FREQUENCY12": 112,
+        "VV_FREQUENCY13": 113, "VV_FREQUENCY14": 114, "VV_FREQUENCY15": 115, "VV_FREQUENCY16": 116,
+        "VV_FREQUENCY17": 117, "VV_FREQUENCY18": 118, "VV_FREQUENCY19": 119, "VV_FREQUENCY20": 120,
+        "VV_FREQUENCY21": 121, "VV_FREQUENCY22": 122, "VV_FREQUENCY23": 123, "VV_FREQUENCY24": 124,
+        "VV_FREQUENCY25": 125, "VV_FREQUENCY26": 126, "VV_FREQUENCY27": 127, "VV_FREQUENCY28": 128,
+        "VV_FREQUENCY29": 129, "VV_FREQUENCY30": 130, "VV_FREQUENCY31": 131, "VV_FREQUENCY32": 132,
+        "VV_FREQUENCY33": 133, "VV_FREQUENCY34": 134, "VV_FREQUENCY35": 135, "VV_FREQUENCY36": 136,
+        "VV_FREQUENCY37": 137, "VV_FREQUENCY38": 138, "VV_FREQUENCY39": 139, "VV_FREQUENCY40": 140,
+        "VV_FREQUENCY41": 141, "VV_FREQUENCY42": 142, "VV_FREQUENCY43": 143, "VV_FREQUENCY44": 144,
+        "VV_FREQUENCY45": 145, "VV_FREQUENCY46": 146, "VV_FREQUENCY47": 147, "VV_FREQUENCY48": 148,
+        "VV_FREQUENCY49": 149, "VV_FREQUENCY50": 150, "VV_FREQUENCY51": 151, "VV_FREQUENCY52": 152,
+        "VV_FREQUENCY53": 153, "VV_FREQUENCY54": 154, "VV_FREQUENCY55": 155, "VV_FREQUENCY56": 156,
+        "VV_FREQUENCY57": 157, "VV_FREQUENCY58": 158, "VV_FREQUENCY59": 159, "VV_FREQUENCY60": 160,
+        "VV_FREQUENCY61": 161, "VV_FREQUENCY62": 162, "VV_FREQUENCY63": 163, "VV_FREQUENCY64": 164,
+        "VV_FREQUENCYDRIVE": 180, "VV_FREQUENCYRESPONSE": 181,
+        "VV_FREQUENCYDRIVE2": 182, "VV_FREQUENCYRESPONSE2": 183,
+        "VV_FREQUENCYDRIVE3": 184, "VV_FREQUENCYRESPONSE3": 185,
+        "VV_FREQUENCYDRIVE4": 186, "VV_FREQUENCYRESPONSE4": 187,
+        "VV_FREQUENCYDEMAND": 190, "VV_FREQUENCYCONTROL": 191,
+        "VV_FREQUENCYDEMAND2": 192, "VV_FREQUENCYCONTROL2": 193,
+        "VV_FREQUENCYDEMAND3": 194, "VV_FREQUENCYCONTROL3": 195,
+        "VV_FREQUENCYDEMAND4": 196, "VV_FREQUENCYCONTROL4": 197
+    },
+    "time_history_enums": {
+        "VV_TIMEHISTORYAXIS": 200,
+        "VV_REARINPUTHISTORY1": 301, "VV_REARINPUTHISTORY2": 302, "VV_REARINPUTHISTORY3": 303, "VV_REARINPUTHISTORY4": 304,
+        "VV_REARINPUTHISTORY5": 305, "VV_REARINPUTHISTORY6": 306, "VV_REARINPUTHISTORY7": 307, "VV_REARINPUTHISTORY8": 308,
+        "VV_REARINPUTHISTORY9": 309, "VV_REARINPUTHISTORY10": 310, "VV_REARINPUTHISTORY11": 311, "VV_REARINPUTHISTORY12": 312,
+        "VV_REARINPUTHISTORY13": 313, "VV_REARINPUTHISTORY14": 314, "VV_REARINPUTHISTORY15": 315, "VV_REARINPUTHISTORY16": 316,
+        "VV_REARINPUTHISTORY17": 317, "VV_REARINPUTHISTORY18": 318, "VV_REARINPUTHISTORY19": 319, "VV_REARINPUTHISTORY20": 320,
+        "VV_REARINPUTHISTORY21": 321, "VV_REARINPUTHISTORY22": 322, "VV_REARINPUTHISTORY23": 323, "VV_REARINPUTHISTORY24": 324,
+        "VV_REARINPUTHISTORY25": 325, "VV_REARINPUTHISTORY26": 326, "VV_REARINPUTHISTORY27": 327, "VV_REARINPUTHISTORY28": 328,
+        "VV_REARINPUTHISTORY29": 329, "VV_REARINPUTHISTORY30": 330, "VV_REARINPUTHISTORY31": 331, "VV_REARINPUTHISTORY32": 332,
+        "VV_REARINPUTHISTORY33": 333, "VV_REARINPUTHISTORY34": 334, "VV_REARINPUTHISTORY35": 335, "VV_REARINPUTHISTORY36": 336,
+        "VV_REARINPUTHISTORY37": 337, "VV_REARINPUTHISTORY38": 338, "VV_REARINPUTHISTORY39": 339, "VV_REARINPUTHISTORY40": 340,
+        "VV_REARINPUTHISTORY41": 341, "VV_REARINPUTHISTORY42": 342, "VV_REARINPUTHISTORY43": 343, "VV_REARINPUTHISTORY44": 344,
+        "VV_REARINPUTHISTORY45": 345, "VV_REARINPUTHISTORY46": 346, "VV_REARINPUTHISTORY47": 347, "VV_REARINPUTHISTORY48": 348,
+        "VV_REARINPUTHISTORY49": 349, "VV_REARINPUTHISTORY50": 350, "VV_REARINPUTHISTORY51": 351, "VV_REARINPUTHISTORY52": 352,
+        "VV_REARINPUTHISTORY53": 353, "VV_REARINPUTHISTORY54": 354, "VV_REARINPUTHISTORY55": 355, "VV_REARINPUTHISTORY56": 356,
+        "VV_REARINPUTHISTORY57": 357, "VV_REARINPUTHISTORY58": 358, "VV_REARINPUTHISTORY59": 359, "VV_REARINPUTHISTORY60": 360,
+        "VV_REARINPUTHISTORY61": 361, "VV_REARINPUTHISTORY62": 362, "VV_REARINPUTHISTORY63": 363, "VV_REARINPUTHISTORY64": 364
+    },
+    "usage_examples": {
+        "waveform_data": {
+            "channel_1_waveform": "GET /api/v1/vector?vectorenum=1",
+            "channel_10_waveform": "GET /api/v1/vector?vectorenum=10",
+            "waveform_time_axis": "GET /api/v1/vector?vectorenum=0",
+            "demand_waveform": "GET /api/v1/vector?vectorenum=90",
+            "control_waveform": "GET /api/v1/vector?vectorenum=91",
         },
-        "time_history_enums": {
-            "VV_TIMEHISTORYAXIS": 200,
-            "VV_REARINPUTHISTORY1": 301, "VV_REARINPUTHISTORY2": 302, "VV_REARINPUTHISTORY3": 303, "VV_REARINPUTHISTORY4": 304,
-            "VV_REARINPUTHISTORY5": 305, "VV_REARINPUTHISTORY6": 306, "VV_REARINPUTHISTORY7": 307, "VV_REARINPUTHISTORY8": 308,
-            "VV_REARINPUTHISTORY9": 309, "VV_REARINPUTHISTORY10": 310, "VV_REARINPUTHISTORY11": 311, "VV_REARINPUTHISTORY12": 312,
-            "VV_REARINPUTHISTORY13": 313, "VV_REARINPUTHISTORY14": 314, "VV_REARINPUTHISTORY15": 315, "VV_REARINPUTHISTORY16": 316,
-            "VV_REARINPUTHISTORY17": 317, "VV_REARINPUTHISTORY18": 318, "VV_REARINPUTHISTORY19": 319, "VV_REARINPUTHISTORY20": 320,
-            "VV_REARINPUTHISTORY21": 321, "VV_REARINPUTHISTORY22": 322, "VV_REARINPUTHISTORY23": 323, "VV_REARINPUTHISTORY24": 324,
-            "VV_REARINPUTHISTORY25": 325, "VV_REARINPUTHISTORY26": 326, "VV_REARINPUTHISTORY27": 327, "VV_REARINPUTHISTORY28": 328,
-            "VV_REARINPUTHISTORY29": 329, "VV_REARINPUTHISTORY30": 330, "VV_REARINPUTHISTORY31": 331, "VV_REARINPUTHISTORY32": 332,
-            "VV_REARINPUTHISTORY33": 333, "VV_REARINPUTHISTORY34": 334, "VV_REARINPUTHISTORY35": 335, "VV_REARINPUTHISTORY36": 336,
-            "VV_REARINPUTHISTORY37": 337, "VV_REARINPUTHISTORY38": 338, "VV_REARINPUTHISTORY39": 339, "VV_REARINPUTHISTORY40": 340,
-            "VV_REARINPUTHISTORY41": 341, "VV_REARINPUTHISTORY42": 342, "VV_REARINPUTHISTORY43": 343, "VV_REARINPUTHISTORY44": 344,
-            "VV_REARINPUTHISTORY45": 345, "VV_REARINPUTHISTORY46": 346, "VV_REARINPUTHISTORY47": 347, "VV_REARINPUTHISTORY48": 348,
-            "VV_REARINPUTHISTORY49": 349, "VV_REARINPUTHISTORY50": 350, "VV_REARINPUTHISTORY51": 351, "VV_REARINPUTHISTORY52": 352,
-            "VV_REARINPUTHISTORY53": 353, "VV_REARINPUTHISTORY54": 354, "VV_REARINPUTHISTORY55": 355, "VV_REARINPUTHISTORY56": 356,
-            "VV_REARINPUTHISTORY57": 357, "VV_REARINPUTHISTORY58": 358, "VV_REARINPUTHISTORY59": 359, "VV_REARINPUTHISTORY60": 360,
-            "VV_REARINPUTHISTORY61": 361, "VV_REARINPUTHISTORY62": 362, "VV_REARINPUTHISTORY63": 363, "VV_REARINPUTHISTORY64": 364
+        "frequency_data": {
+            "channel_1_frequency": "GET /api/v1/vector?vectorenum=101",
+            "channel_20_frequency": "GET /api/v1/vector?vectorenum=120",
+            "frequency_axis": "GET /api/v1/vector?vectorenum=100",
+            "drive_frequency": "GET /api/v1/vector?vectorenum=180",
+            "response_frequency": "GET /api/v1/vector?vectorenum=181",
         },
-        "usage_examples": {
-            "waveform_data": {
-                "channel_1_waveform": "GET /api/v1/vector?vectorenum=1",
-                "channel_10_waveform": "GET /api/v1/vector?vectorenum=10",
-                "waveform_time_axis": "GET /api/v1/vector?vectorenum=0",
-                "demand_waveform": "GET /api/v1/vector?vectorenum=90",
-                "control_waveform": "GET /api/v1/vector?vectorenum=91",
-            },
-            "frequency_data": {
-                "channel_1_frequency": "GET /api/v1/vector?vectorenum=101",
-                "channel_20_frequency": "GET /api/v1/vector?vectorenum=120",
-                "frequency_axis": "GET /api/v1/vector?vectorenum=100",
-                "drive_frequency": "GET /api/v1/vector?vectorenum=180",
-                "response_frequency": "GET /api/v1/vector?vectorenum=181",
-            },
-            "time_history_data": {
-                "rear_input_1_history": "GET /api/v1/vector?vectorenum=301",
-                "rear_input_32_history": "GET /api/v1/vector?vectorenum=332",
-                "time_history_axis": "GET /api/v1/vector?vectorenum=200",
-            },
+        "time_history_data": {
+            "rear_input_1_history": "GET /api/v1/vector?vectorenum=301",
+            "rear_input_32_history": "GET /api/v1/vector?vectorenum=332",
+            "time_history_axis": "GET /api/v1/vector?vectorenum=200",
         },
-        "notes": [
-            "All vector enumerations correspond to specific data types in VibrationVIEW",
-            "Waveform vectors (1-64) provide time-domain data for input channels",
-            "Frequency vectors (101-164) provide frequency-domain data for input channels",
-            "Rear input history vectors (301-364) provide time history for auxiliary inputs",
-            "Axis vectors (0, 100, 200) provide corresponding axis data for plotting",
-            "Control/Demand vectors provide waveform and frequency data for output loops",
-            "Drive/Response vectors provide frequency response analysis data",
-            "Vector availability depends on test type and hardware configuration",
-            "Vector is superseded by ReportVector in VibrationVIEW 2025.3 and later",
-        ],
-    }
-    return jsonify(success_response(enums))
+    },
+    "notes": [
+        "All vector enumerations correspond to specific data types in VibrationVIEW",
+        "Waveform vectors (1-64) provide time-domain data for input channels",
+        "Frequency vectors (101-164) provide frequency-domain data for input channels",
+        "Rear input history vectors (301-364) provide time history for auxiliary inputs",
+        "Axis vectors (0, 100, 200) provide corresponding axis data for plotting",
+        "Control/Demand vectors provide waveform and frequency data for output loops",
+        "Drive/Response vectors provide frequency response analysis data",
+        "Vector availability depends on test type and hardware configuration",
+        "Vector is superseded by ReportVector in VibrationVIEW 2025.3 and later",
+    ],
+}
 # fmt: on
 
+# Served in the success envelope (without a per-request timestamp) so the body
+# and its ETag stay constant
+_VECTOR_ENUMS_DOCUMENT = StaticJSONDocument(
+    {"success": True, "message": "Operation completed successfully", "data": VECTOR_ENUMS}
+)
+
+
+@vectors_legacy_bp.route("/docs/vector_enums", methods=["GET"])
+def get_vector_enumerations() -> Response:
+    """Get complete vector enumeration reference"""
+    return _VECTOR_ENUMS_DOCUMENT.response()
+
 
 # ============================================================================
 # VECTOR DATA
 # ============================================================================
 
+# Binary /vector layout: little-endian uint32 row count and points per row,
+# followed by the float64 samples in row order
+_VECTOR_BINARY_HEADER = struct.Struct("<II")
+_VECTOR_SAMPLE_SIZE = array("d").itemsize
+
+
+def _wants_binary_vector(data: Any = None) -> bool:
+    """Return True when the client asked for the binary /vector format"""
+    fmt = data.get("format") if isinstance(data, dict) else request.args.get("format")
+    if fmt is not None:
+        return fmt == "bin"
+    return request.accept_mimetypes.best_match(("application/json", "application/octet-stream")) == (
+        "application/octet-stream"
+    )
+
+
+def _vector_binary_response(result: Sequence[Sequence[float]]) -> Response:
+    """Pack a rectangular Vector() result into the binary /vector layout"""
+    rows = len(result) if result else 0
+    points = len(result[0]) if rows else 0
+
+    samples = array("d")
+    for row in result or ():
+        if len(row) != points:
+            raise APIError("Vector rows have different lengths; use the JSON format", "INVALID_VECTOR_SHAPE")
+        samples.extend(row)
+    if sys.byteorder != "little":
+        samples.byteswap()
+
+    return Response(_VECTOR_BINARY_HEADER.pack(rows, points) + samples.tobytes(), mimetype="application/octet-stream")
+
 
-@vectors_legacy_bp.route("/vector", methods=["GET", "POST"])
+def _vector_head_response(vv_instance: Any, vectorenum: int, columns: int) -> Response:
+    """Describe the /vector result size from VectorLength() without fetching the data"""
+    points = vv_instance.VectorLength(vectorenum)
+    if _wants_binary_vector():
+        response = Response(mimetype="application/octet-stream")
+        response.content_length = _VECTOR_BINARY_HEADER.size + columns * points * _VECTOR_SAMPLE_SIZE
+    else:
+        response = Response(mimetype="application/json")
+        # The JSON body size is unknown until the data is serialized
+        response.automatically_set_content_length = False
+    response.headers["X-Vector-Rows"] = str(columns)
+    response.headers["X-Vector-Points"] = str(points)
+    return response
+
+
+@vectors_legacy_bp.route("/vector", methods=["GET", "HEAD", "POST"])
 @handle_errors
 @with_vibrationview
 def vector(vv_instance: Any) -> Response:
@@ -220,16 +303,27 @@ def vector(vv_instance: Any) -> Response:
     GET Query Parameters:
         vectorenum: Vector enumeration identifier (required, or use as first query param)
         columns: Number of columns (optional, default: 1)
+        format: "bin" for the binary layout (optional, default: JSON)
 
     POST JSON Body:
         vectorenum: Vector enumeration identifier (required)
         columns: Number of columns (optional, default: 1)
+        format: "bin" for the binary layout (optional, default: JSON)
+
+    Binary layout (format=bin or Accept: application/octet-stream):
+        Two little-endian uint32 values (rows, points per row) followed by
+        rows * points little-endian float64 samples in row order.
+
+    HEAD (same query parameters as GET):
+        Calls VectorLength() instead of Vector() and returns X-Vector-Rows and
+        X-Vector-Points headers, plus the exact Content-Length for format=bin.
 
     Examples:
         GET /api/v1/vector?vectorenum=1
         GET /api/v1/vector?vectorenum=2&columns=4
         GET /api/v1/vector?1
         GET /api/v1/vector?2&columns=4
+        GET /api/v1/vector?vectorenum=1&format=bin
 
         POST /api/v1/vector
         Body: {"vectorenum": 1}
@@ -239,9 +333,10 @@ def vector(vv_instance: Any) -> Response:
     """
     vectorenum = None
     columns = 1
+    data = None
 
-    # Handle GET request
-    if request.method == "GET":
+    # Handle GET/HEAD request
+    if request.method in ("GET", "HEAD"):
         vectorenum = request.args.get("vectorenum", type=int)
         # If no 'vectorenum' parameter, use the first query parameter key as the value
         if vectorenum is None and request.args:
@@ -266,9 +361,15 @@ def vector(vv_instance: Any) -> Response:
     if columns < 1:
         raise APIError(f"columns must be >= 1, got {columns}", "INVALID_PARAMETER")
 
+    if request.method == "HEAD":
+        return _vector_head_response(vv_instance, vectorenum, columns)
+
     # Note: library wrapper suppresses COM exceptions and returns dummy array on failure
     result = vv_instance.Vector(vectorenum, columns)
 
+    if _wants_binary_vector(data):
+        return _vector_binary_response(result)
+
     return jsonify(
         success_response(
             {"result": result, "vectorenum": vectorenum, "columns": columns, "rows": len(result) if result else 0},
@@ -277,6 +378,76 @@ def vector(vv_instance: Any) -> Response:
     )
 
 
+# Each vector is a separate COM call on the single STA thread
+MAX_VECTORS_PER_REQUEST = 32
+
+
+def _is_int(value: Any) -> bool:
+    """Return True for JSON integers (bool is excluded)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+@vectors_legacy_bp.route("/vectors", methods=["GET", "POST"])
+@handle_errors
+@with_vibrationview
+def vectors(vv_instance: Any) -> Response:
+    """
+    Get several raw data vectors in one request
+
+    COM Method: Vector(vectorenum, columns) for each requested enumeration
+    Saves a round trip per vector for clients that plot e.g. an axis together
+    with demand and control. Repeated enumerations are fetched once, and at
+    most MAX_VECTORS_PER_REQUEST distinct enumerations are accepted.
+
+    GET Query Parameters:
+        enums: Comma-separated vector enumeration identifiers (required)
+        columns: Number of columns for every vector (optional, default: 1)
+
+    POST JSON Body:
+        enums: List of vector enumeration identifiers (required)
+        columns: Number of columns for every vector (optional, default: 1)
+
+    Examples:
+        GET /api/v1/vectors?enums=0,1,90,91
+        POST /api/v1/vectors
+        Body: {"enums": [100, 101, 190, 191], "columns": 1}
+    """
+    if request.method == "GET":
+        try:
+            enums = [int(item) for item in request.args.get("enums", "").split(",") if item.strip()]
+        except ValueError:
+            raise APIError("enums must be a comma-separated list of integers", "INVALID_PARAMETER")
+        columns = request.args.get("columns", type=int, default=1)
+    else:
+        data = request.get_json(silent=True) or {}
+        enums = data.get("enums", [])
+        columns = data.get("columns", 1)
+        if not isinstance(enums, list) or not all(_is_int(item) for item in enums):
+            raise APIError("enums must be a list of integers", "INVALID_PARAMETER")
+        if not _is_int(columns):
+            raise APIError("columns must be an integer", "INVALID_PARAMETER")
+
+    if not enums:
+        raise APIError("Missing required parameter: enums", "MISSING_PARAMETER")
+
+    # Each enumeration is one Vector() COM call, so repeats are fetched once
+    enums = list(dict.fromkeys(enums))
+    if len(enums) > MAX_VECTORS_PER_REQUEST:
+        raise APIError(f"At most {MAX_VECTORS_PER_REQUEST} vectors per request, got {len(enums)}", "INVALID_PARAMETER")
+
+    if columns < 1:
+        raise APIError(f"columns must be >= 1, got {columns}", "INVALID_PARAMETER")
+
+    results = {str(vectorenum): vv_instance.Vector(vectorenum, columns) for vectorenum in enums}
+
+    return jsonify(
+        success_response(
+            {"results": results, "columns": columns, "count": len(results)},
+            f"Retrieved {len(results)} vectors with {columns} columns",
+        )
+    )
+
+
 # ============================================================================
 # VECTOR PROPERTIES
 # ============================================================================
@@ -317,7 +488,7 @@ def vector_unit(vv_instance: Any) -> Response:
 
     result = vv_instance.VectorUnit(vectorenum)
 
-    return jsonify(success_response({"result": result, "vectorenum": vectorenum}))
+    return cacheable_response(success_response({"result": result, "vectorenum": vectorenum}))
 
 
 @vectors_legacy_bp.route("/vectorlabel", methods=["GET"])
@@ -355,7 +526,7 @@ def vector_label(vv_instance: Any) -> Response:
 
     result = vv_instance.VectorLabel(vectorenum)
 
-    return jsonify(success_response({"result": result, "vectorenum": vectorenum}))
+    return cacheable_response(success_response({"result": result, "vectorenum": vectorenum}))
 
 
 @vectors_legacy_bp.route("/vectorlength", methods=["GET"])
@@ -393,4 +564,4 @@ def vector_length(vv_instance: Any) -> Response:
 
     result = vv_instance.VectorLength(vectorenum)
 
-    return jsonify(success_response({"result": result, "vectorenum": vectorenum}))
+    return cacheable_response(success_response({"result": result, "vectorenum": vectorenum}))
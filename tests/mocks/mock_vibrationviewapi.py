@@ -92,6 +92,14 @@ class MockVibrationVIEW:
         self.VectorLabel = MagicMock()
         self.VectorLength = MagicMock()
 
+        # Add GUI control methods (window commands return nothing)
+        self.EditTest = MagicMock(return_value=True)
+        self.AbortEdit = MagicMock(return_value=None)
+        self.Minimize = MagicMock(return_value=None)
+        self.Restore = MagicMock(return_value=None)
+        self.Maximize = MagicMock(return_value=None)
+        self.Activate = MagicMock(return_value=None)
+
         # Add input configuration methods
         self.InputMode = MagicMock(return_value=None)
         self.InputCalibration = MagicMock(return_value=True)
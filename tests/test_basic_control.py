@@ -13,6 +13,7 @@ from unittest.mock import patch
 import pytest
 
 from app import get_vv_instance
+from config import Config
 from utils.exceptions import APIError
 
 
@@ -153,6 +154,35 @@ class TestBasicControl:
 
             mock_upload.assert_called_once()
 
+    def test_opentest_upload_closes_existing_tab_with_same_name(self, client):
+        """Uploading a file whose name is already open closes that tab first"""
+        filename = "Sine_Test.vsp"
+        self.mock_instance.ListOpenTests.return_value = (
+            ("1", "Random", "Stopped", "other_test"),
+            ("2", "Sine", "Stopped", "sine_test"),
+            ("3", "Shock", "Stopped", None),
+        )
+
+        with patch("routes.basic_control.process_file_upload") as mock_upload:
+            mock_upload.return_value = (f"/regular/upload/path/{filename}", filename)
+            response = client.put(f"/api/v1/opentest?filename={filename}", data=b"content")
+
+        assert response.status_code == 200
+        self.mock_instance.CloseTab.assert_called_once_with(2)
+        self.mock_instance.OpenTest.assert_called_once_with(f"/regular/upload/path/{filename}")
+
+    def test_opentest_upload_no_matching_tab(self, client):
+        """No tab is closed when the uploaded name is not already open"""
+        filename = "new_test.vsp"
+        self.mock_instance.ListOpenTests.return_value = (("1", "Random", "Stopped", "other_test"),)
+
+        with patch("routes.basic_control.process_file_upload") as mock_upload:
+            mock_upload.return_value = (f"/regular/upload/path/{filename}", filename)
+            response = client.put(f"/api/v1/opentest?filename={filename}", data=b"content")
+
+        assert response.status_code == 200
+        self.mock_instance.CloseTab.assert_not_called()
+
     def test_template_extension_detection(self):
         """Test the template extension detection utility function"""
         from utils.utils import is_template_file
@@ -264,6 +294,33 @@ class TestBasicControl:
         assert data["success"] is True
         assert data["data"]["profile_name"] == profile_name
 
+    def test_closetest_unnamed_parameter_utf8(self, client):
+        """Test /closetest decodes non-ASCII unnamed parameters as UTF-8"""
+        profile_name = "Prüfung 1.vsp"
+        self.mock_instance.CloseTest.return_value = True
+
+        # Percent-encoded form, as sent by browsers and most HTTP clients
+        response = client.get("/api/v1/closetest?Pr%C3%BCfung%201.vsp")
+        assert response.status_code == 200
+        assert json.loads(response.data)["data"]["profile_name"] == profile_name
+
+        # Raw UTF-8 bytes in the query string must not be decoded as latin-1
+        raw_query = "Prüfung 1.vsp".encode("utf-8").decode("latin-1")
+        response = client.get("/api/v1/closetest", environ_overrides={"QUERY_STRING": raw_query})
+        assert response.status_code == 200
+        assert json.loads(response.data)["data"]["profile_name"] == profile_name
+
+    @pytest.mark.parametrize("profile_name", ["Test+Run.vsp", "A&B.vsp", "x=1.vsp"])
+    def test_closetest_unnamed_parameter_reserved_characters(self, client, profile_name):
+        """Unnamed parameters are taken verbatim, not re-parsed as form-encoded key/value pairs"""
+        self.mock_instance.CloseTest.return_value = True
+
+        response = client.get(f"/api/v1/closetest?{profile_name}")
+
+        assert response.status_code == 200
+        assert json.loads(response.data)["data"]["profile_name"] == profile_name
+        self.mock_instance.CloseTest.assert_called_once_with(profile_name)
+
     def test_closetest_not_closed(self, client):
         """Test /closetest when profile was not closed (returns False)"""
         profile_name = "nonexistent_profile.vsp"
@@ -469,3 +526,98 @@ class TestSaveData:
         assert data["error"]["code"] == "DIRECTORY_CREATE_ERROR"
         assert "Permission denied" in data["error"]["message"]
         self.mock_instance.SaveData.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "filename,prefixed",
+        [
+            ("testfile.vsd", True),
+            ("sub/testfile.vsd", False),
+            (r"C:\Data\testfile.vsd", False),
+        ],
+    )
+    def test_savedata_bare_filename_uses_data_folder(self, client, filename, prefixed):
+        """Test that only bare filenames are placed in DATA_FOLDER"""
+        with patch("routes.basic_control.validate_file_path", side_effect=lambda p, _op: p) as mock_validate:
+            response = client.post("/api/v1/savedata", query_string={"filename": filename})
+
+        assert response.status_code == 200
+        expected = os.path.join(Config.DATA_FOLDER, filename) if prefixed else filename
+        assert mock_validate.call_args[0][0] == expected
+
+
+class TestOpenTestsCache:
+    """ListOpenTests() results are reused briefly and dropped on open/close."""
+
+    @pytest.fixture(autouse=True)
+    def _setup_mock(self, client):
+        self.mock_instance = get_vv_instance()
+        self.mock_instance.ListOpenTests.return_value = (("1", "Sine", "C:\\a.vsp", "a"),)
+
+    def test_result_reused_within_ttl(self):
+        from utils.vv_manager import list_open_tests_cached
+
+        first = list_open_tests_cached(self.mock_instance, ttl=60)
+        second = list_open_tests_cached(self.mock_instance, ttl=60)
+
+        assert first is second
+        self.mock_instance.ListOpenTests.assert_called_once()
+
+    def test_zero_ttl_disables_cache(self):
+        from utils.vv_manager import list_open_tests_cached
+
+        list_open_tests_cached(self.mock_instance, ttl=0)
+        list_open_tests_cached(self.mock_instance, ttl=0)
+
+        assert self.mock_instance.ListOpenTests.call_count == 2
+
+    def test_other_instance_not_served_from_cache(self):
+        from tests.mocks.mock_vibrationviewapi import MockVibrationVIEW
+        from utils.vv_manager import list_open_tests_cached
+
+        list_open_tests_cached(self.mock_instance, ttl=60)
+        other = MockVibrationVIEW()
+        list_open_tests_cached(other, ttl=60)
+
+        other.ListOpenTests.assert_called_once()
+
+    def test_closetab_invalidates_cache(self, client):
+        from utils.vv_manager import list_open_tests_cached
+
+        list_open_tests_cached(self.mock_instance, ttl=60)
+        self.mock_instance.CloseTab.return_value = True
+        client.post("/api/v1/closetab?tabindex=0")
+        list_open_tests_cached(self.mock_instance, ttl=60)
+
+        assert self.mock_instance.ListOpenTests.call_count == 2
+
+    def test_opentest_upload_reads_tabs_live(self, client):
+        """The duplicate-name check never uses cached tab indices for CloseTab()"""
+        from utils.vv_manager import list_open_tests_cached
+
+        list_open_tests_cached(self.mock_instance, ttl=60)
+        # Tab 1 was closed in the VibrationVIEW UI; "a" is now tab 0
+        self.mock_instance.ListOpenTests.return_value = (("0", "Sine", "C:\\a.vsp", "a"),)
+
+        with patch.object(Config, "OPEN_TESTS_CACHE_TTL", 60):
+            with patch("routes.basic_control.process_file_upload") as mock_upload:
+                mock_upload.return_value = ("/regular/upload/path/a.vsp", "a.vsp")
+                response = client.put("/api/v1/opentest?filename=a.vsp", data=b"content")
+
+        assert response.status_code == 200
+        assert self.mock_instance.ListOpenTests.call_count == 2
+        self.mock_instance.CloseTab.assert_called_once_with(0)
+
+    def test_listopentests_endpoint_uses_cache(self, client):
+        with patch.object(Config, "OPEN_TESTS_CACHE_TTL", 60):
+            client.get("/api/v1/listopentests")
+            response = client.get("/api/v1/listopentests")
+
+        assert json.loads(response.data)["data"]["count"] == 1
+        self.mock_instance.ListOpenTests.assert_called_once()
+
+        self.mock_instance.CloseTab.return_value = True
+        with patch.object(Config, "OPEN_TESTS_CACHE_TTL", 60):
+            client.post("/api/v1/closetab?tabindex=1")
+            client.get("/api/v1/listopentests")
+
+        assert self.mock_instance.ListOpenTests.call_count == 2
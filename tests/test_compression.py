@@ -0,0 +1,87 @@
+# ============================================================================
+# FILE: tests/test_compression.py
+# ============================================================================
+
+"""
+Tests for gzip compression of large JSON responses
+"""
+
+import gzip
+import json
+
+import pytest
+
+from app import create_app, get_vv_instance, reset_vv_instance, set_vv_instance
+from config import TestingConfig
+
+
+class TestCompression:
+    @pytest.fixture(autouse=True)
+    def _setup_mock(self, client):
+        self.mock_instance = get_vv_instance()
+
+    def test_large_json_is_gzipped(self, client):
+        """Large JSON responses are compressed when the client accepts gzip"""
+        self.mock_instance.Channel.return_value = [1.0] * 1000
+
+        response = client.get("/api/v1/channel", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        data = json.loads(gzip.decompress(response.data))
+        assert data["data"]["result"] == [1.0] * 1000
+
+    def test_not_gzipped_without_accept_encoding(self, client):
+        """Clients that do not advertise gzip get the identity body"""
+        self.mock_instance.Channel.return_value = [1.0] * 1000
+
+        response = client.get("/api/v1/channel")
+
+        assert "Content-Encoding" not in response.headers
+        assert json.loads(response.data)["data"]["result"] == [1.0] * 1000
+
+    def test_small_json_not_gzipped(self, client):
+        """Responses below GZIP_MIN_SIZE are sent uncompressed"""
+        self.mock_instance.IsRunning.return_value = False
+
+        response = client.get("/api/v1/isrunning", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert json.loads(response.data)["success"] is True
+
+    def test_docs_served_from_prebuilt_gzip(self, client):
+        """Documentation is compressed once and keeps its own ETag for 304s"""
+        headers = {"Accept-Encoding": "gzip"}
+        identity = client.get("/api/v1/docs/vector_enums")
+        first = client.get("/api/v1/docs/vector_enums", headers=headers)
+        second = client.get("/api/v1/docs/vector_enums", headers=headers)
+
+        assert first.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in first.headers["Vary"]
+        assert gzip.decompress(first.data) == identity.data
+        assert first.data == second.data
+        etag = first.headers["ETag"]
+        assert etag != identity.headers["ETag"]
+
+        revalidated = client.get("/api/v1/docs/vector_enums", headers={**headers, "If-None-Match": etag})
+        assert revalidated.status_code == 304
+
+
+class TestCompressionDisabled:
+    class NoCompressionConfig(TestingConfig):
+        GZIP_MIN_SIZE = 0
+
+    @pytest.fixture
+    def uncompressed_client(self, mock_vv_manager_with_api):
+        set_vv_instance(mock_vv_manager_with_api)
+        app = create_app(self.NoCompressionConfig)
+        app.config["TESTING"] = True
+        yield app.test_client()
+        reset_vv_instance()
+
+    def test_zero_min_size_disables_compression(self, uncompressed_client):
+        response = uncompressed_client.get("/api/v1/docs/vector_enums", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
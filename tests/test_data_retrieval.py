@@ -9,10 +9,13 @@ Matches current implementation with GET requests and query parameters
 """
 
 import json
+import struct
+from unittest.mock import patch
 
 import pytest
 
 from app import get_vv_instance
+from routes.vectors_legacy import MAX_VECTORS_PER_REQUEST
 
 
 class TestDataRetrieval:
@@ -204,6 +207,26 @@ class TestDataRetrieval:
 
         print("✓ Output endpoint works correctly!")
 
+    def test_snapshot(self, client):
+        """Test snapshot endpoint returns all primary arrays"""
+        self.mock_vv.Demand.return_value = [1.0]
+        self.mock_vv.Control.return_value = [1.1]
+        self.mock_vv.Channel.return_value = [0.5, float("nan")]
+        self.mock_vv.Output.return_value = [2.5]
+
+        response = client.get("/api/v1/snapshot")
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+
+        assert data["success"] is True
+        assert data["data"] == {
+            "demand": [1.0],
+            "control": [1.1],
+            "channel": [0.5, None],
+            "output": [2.5],
+        }
+
     # ============================================================================
     # VECTOR DATA TESTS
     # ============================================================================
@@ -266,6 +289,129 @@ class TestDataRetrieval:
 
         print("✓ Vector endpoint with columns works correctly!")
 
+    @pytest.mark.parametrize(
+        "method,kwargs",
+        [
+            ("get", {"query_string": {"vectorenum": 2, "columns": 2, "format": "bin"}}),
+            (
+                "get",
+                {"query_string": {"vectorenum": 2, "columns": 2}, "headers": {"Accept": "application/octet-stream"}},
+            ),
+            ("post", {"json": {"vectorenum": 2, "columns": 2, "format": "bin"}}),
+        ],
+    )
+    def test_vector_binary_format(self, client, method, kwargs):
+        """Test vector endpoint binary layout: uint32 rows, uint32 points, float64 samples"""
+        self.mock_vv.Vector.return_value = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.5]]
+
+        response = getattr(client, method)("/api/v1/vector", **kwargs)
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/octet-stream"
+        rows, points = struct.unpack_from("<II", response.data)
+        assert (rows, points) == (2, 3)
+        assert struct.unpack_from("<6d", response.data, 8) == (1.0, 2.0, 3.0, 4.0, 5.0, 6.5)
+        assert len(response.data) == 8 + 6 * 8
+
+    def test_vector_binary_ragged_rows_rejected(self, client):
+        """Test binary vector format rejects rows of different lengths"""
+        self.mock_vv.Vector.return_value = [[1.0, 2.0], [3.0]]
+
+        response = client.get("/api/v1/vector?vectorenum=2&columns=2&format=bin")
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["error"]["code"] == "INVALID_VECTOR_SHAPE"
+
+    def test_vector_head_binary_reports_size(self, client):
+        """Test HEAD /vector sizes the binary body from VectorLength without calling Vector"""
+        self.mock_vv.Vector.reset_mock()
+        self.mock_vv.VectorLength.return_value = 1024
+
+        response = client.head("/api/v1/vector?vectorenum=1&columns=4&format=bin")
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/octet-stream"
+        assert response.content_length == 8 + 4 * 1024 * 8
+        assert response.headers["X-Vector-Rows"] == "4"
+        assert response.headers["X-Vector-Points"] == "1024"
+        assert response.data == b""
+        self.mock_vv.VectorLength.assert_called_with(1)
+        self.mock_vv.Vector.assert_not_called()
+
+    def test_vector_head_json(self, client):
+        """Test HEAD /vector for JSON returns dimensions without a guessed Content-Length"""
+        self.mock_vv.Vector.reset_mock()
+        self.mock_vv.VectorLength.return_value = 512
+
+        response = client.head("/api/v1/vector?2")
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+        assert "Content-Length" not in response.headers
+        assert response.headers["X-Vector-Rows"] == "1"
+        assert response.headers["X-Vector-Points"] == "512"
+        self.mock_vv.Vector.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "method,kwargs",
+        [
+            ("get", {"query_string": {"enums": "0,1,90,1"}}),
+            ("post", {"json": {"enums": [0, 1, 90, 1]}}),
+        ],
+    )
+    def test_vectors_batch(self, client, method, kwargs):
+        """Test vectors endpoint returns each requested vector keyed by enum, fetching repeats once"""
+        with patch.object(
+            self.mock_vv, "Vector", side_effect=lambda vectorenum, columns: [[float(vectorenum)] * 2]
+        ) as mock_vector:
+            response = getattr(client, method)("/api/v1/vectors", **kwargs)
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["data"]["results"] == {"0": [[0.0, 0.0]], "1": [[1.0, 1.0]], "90": [[90.0, 90.0]]}
+        assert data["data"]["count"] == 3
+        assert [c.args for c in mock_vector.call_args_list] == [(0, 1), (1, 1), (90, 1)]
+
+    @pytest.mark.parametrize(
+        "query,code",
+        [("", "MISSING_PARAMETER"), ("?enums=1,abc", "INVALID_PARAMETER"), ("?enums=1&columns=0", "INVALID_PARAMETER")],
+    )
+    def test_vectors_batch_invalid_parameters(self, client, query, code):
+        """Test vectors endpoint parameter validation"""
+        response = client.get(f"/api/v1/vectors{query}")
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["error"]["code"] == code
+
+    @pytest.mark.parametrize(
+        "body,code",
+        [
+            ({}, "MISSING_PARAMETER"),
+            ({"enums": "12"}, "INVALID_PARAMETER"),
+            ({"enums": ["1"]}, "INVALID_PARAMETER"),
+            ({"enums": [True]}, "INVALID_PARAMETER"),
+            ({"enums": [1], "columns": "2"}, "INVALID_PARAMETER"),
+            ({"enums": [1], "columns": 0}, "INVALID_PARAMETER"),
+        ],
+    )
+    def test_vectors_batch_invalid_body(self, client, body, code):
+        """Test vectors endpoint rejects non-list enums and non-integer columns without calling COM"""
+        with patch.object(self.mock_vv, "Vector") as mock_vector:
+            response = client.post("/api/v1/vectors", json=body)
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["error"]["code"] == code
+        mock_vector.assert_not_called()
+
+    def test_vectors_batch_too_many_enums(self, client):
+        """Test vectors endpoint caps the number of distinct vectors per request"""
+        with patch.object(self.mock_vv, "Vector") as mock_vector:
+            response = client.post("/api/v1/vectors", json={"enums": list(range(MAX_VECTORS_PER_REQUEST + 1))})
+
+        assert response.status_code == 400
+        assert json.loads(response.data)["error"]["code"] == "INVALID_PARAMETER"
+        mock_vector.assert_not_called()
+
     def test_vector_missing_vectorenum(self, client):
         """Test vector endpoint with missing vectorenum parameter"""
         response = client.get("/api/v1/vector")
@@ -353,6 +499,46 @@ class TestDataRetrieval:
 
         print("✓ VectorLabel works correctly!")
 
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/api/v1/channelunit?1",
+            "/api/v1/channellabel?1",
+            "/api/v1/controlunit?1",
+            "/api/v1/controllabel?1",
+            "/api/v1/vectorunit?1",
+            "/api/v1/vectorlabel?1",
+            "/api/v1/vectorlength?1",
+        ],
+    )
+    def test_label_cache_control(self, client, url):
+        """Label/unit/length lookups are only cacheable when LABEL_CACHE_MAX_AGE is set"""
+        for method in ("ChannelUnit", "ChannelLabel", "ControlUnit", "ControlLabel", "VectorUnit", "VectorLabel"):
+            getattr(self.mock_vv, method).return_value = "g"
+        self.mock_vv.VectorLength.return_value = 1024
+
+        response = client.get(url)
+        assert response.status_code == 200
+        assert "Cache-Control" not in response.headers
+
+        client.application.config["LABEL_CACHE_MAX_AGE"] = 30
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert response.cache_control.private
+        assert not response.cache_control.public
+        assert response.cache_control.max_age == 30
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+    def test_label_cache_control_not_on_errors(self, client):
+        """Error responses are never marked cacheable"""
+        client.application.config["LABEL_CACHE_MAX_AGE"] = 30
+
+        response = client.get("/api/v1/vectorlabel?abc")
+
+        assert response.status_code == 400
+        assert "Cache-Control" not in response.headers
+
     def test_vector_length(self, client):
         """Test VectorLength endpoint - no base conversion"""
         # Configure mock
@@ -564,6 +750,28 @@ class TestDataRetrieval:
 
         print("✓ Control parameter validation works!")
 
+    @pytest.mark.parametrize(
+        "query,expected_0based",
+        [("", 0), ("?2", 1), ("?loopnum=3", 2)],
+    )
+    def test_control_unit_loopnum_forms(self, client, query, expected_0based):
+        """Test that loopnum defaults to 1 and accepts named or bare values"""
+        self.mock_vv.ControlUnit.reset_mock()
+        self.mock_vv.ControlUnit.return_value = "g"
+
+        response = client.get(f"/api/v1/controlunit{query}")
+
+        assert response.status_code == 200
+        self.mock_vv.ControlUnit.assert_called_once_with(expected_0based)
+
+    def test_control_unit_non_integer_loopnum(self, client):
+        """Test that a non-integer loopnum is rejected"""
+        response = client.get("/api/v1/controlunit?loopnum=abc")
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data["error"]["message"] == "loopnum must be an integer"
+
     # ============================================================================
     # DOCUMENTATION TESTS
     # ============================================================================
@@ -604,6 +812,8 @@ class TestDataRetrieval:
         assert "frequency_enums" in data["data"]
         assert "time_history_enums" in data["data"]
         assert "usage_examples" in data["data"]
+        # Served from a prebuilt body, so no per-request timestamp (see CHANGELOG)
+        assert set(data) == {"success", "message", "data"}
 
         print("✓ Vector enumerations documentation endpoint works!")
 
@@ -7,7 +7,9 @@ Tests to verify all file extensions are recognized as valid
 and routed to the correct folders.
 """
 
-from unittest.mock import patch
+import io
+import os
+from unittest.mock import PropertyMock, patch
 
 import pytest
 
@@ -20,6 +22,7 @@ from utils.utils import (
     PROFILE_EXTENSIONS,
     REPORT_EXTENSIONS,
     TEMPLATE_EXTENSIONS,
+    detect_file_upload,
     get_folder_for_extension,
     handle_binary_upload,
 )
@@ -219,11 +222,62 @@ class TestBinaryUploadAcceptance:
             result = handle_binary_upload(f"test.{ext}", b"data")
             assert result["FilePath"].endswith(f".{ext}")
 
+    def test_upload_accepts_stream(self, tmp_path):
+        """Streams are copied to disk in chunks rather than read into memory."""
+        payload = b"x" * (3 * 64 * 1024 + 17)
+        with patch.object(Config, "PROFILE_FOLDER", str(tmp_path)):
+            result = handle_binary_upload("streamed.vyp", io.BytesIO(payload))
+        assert result["Size"] == len(payload)
+        with open(result["FilePath"], "rb") as f:
+            assert f.read() == payload
+
+    def test_failed_stream_leaves_no_partial_file(self, tmp_path):
+        """A body that fails mid-copy must not replace or leave files behind."""
+
+        class BrokenStream(io.RawIOBase):
+            def readinto(self, buffer):
+                raise OSError("connection reset")
+
+        with patch.object(Config, "PROFILE_FOLDER", str(tmp_path)):
+            with pytest.raises(OSError):
+                handle_binary_upload("broken.vyp", BrokenStream())
+        assert os.listdir(tmp_path / "Uploads") == []
+
     def test_upload_rejected_for_unknown_extension(self):
         with pytest.raises(APIError, match="Invalid file extension"):
             handle_binary_upload("test.xyz", b"data")
 
 
+class TestDetectFileUpload:
+    """detect_file_upload should only parse form data for multipart bodies."""
+
+    def test_raw_body_does_not_parse_form(self, app):
+        from flask import Request
+
+        with app.test_request_context(
+            "/api/v1/opentest?filename=test.vsp",
+            method="PUT",
+            data=b"profile",
+            content_type="application/octet-stream",
+        ):
+            with patch.object(Request, "files", new_callable=PropertyMock) as mock_files:
+                filename, stream, _ = detect_file_upload()
+            mock_files.assert_not_called()
+            assert filename == "test.vsp"
+            assert stream.read() == b"profile"
+
+    def test_multipart_body_detected(self, app):
+        with app.test_request_context(
+            "/api/v1/opentest",
+            method="POST",
+            data={"file": (io.BytesIO(b"profile"), "upload.vsp")},
+            content_type="multipart/form-data",
+        ):
+            filename, stream, _ = detect_file_upload()
+            assert filename == "upload.vsp"
+            assert stream.read() == b"profile"
+
+
 class TestSecureFilenameValidation:
     """handle_binary_upload rejects filenames that become empty or extensionless after sanitization."""
 
@@ -225,3 +225,15 @@ class TestGetDataFileSecurity:
             assert data["success"] is False
             assert "File not found" in data["error"]["message"]
             assert data["error"]["code"] == "FILE_NOT_FOUND"
+
+    def test_getdatafile_malformed_json_falls_back_to_query(self, client, mock_vv, mock_config):
+        """Test /getdatafile ignores an unparseable JSON body and uses the query parameter"""
+        response = client.post(
+            "/api/v1/getdatafile?file_path=C:\\Windows\\System32\\evil.exe",
+            data="{not json",
+            content_type="application/json",
+        )
+
+        assert response.status_code == 403
+        data = json.loads(response.data)
+        assert data["error"]["code"] == "PATH_VALIDATION_ERROR"
@@ -9,6 +9,7 @@ Tests for GUI control route APIError cases
 import json
 
 from app import get_vv_instance
+from utils.vv_error_codes import DISP_E_EXCEPTION, VVIEW_E_TEST_NOT_FOUND
 
 
 class TestGuiControl:
@@ -20,3 +21,81 @@ class TestGuiControl:
         data = json.loads(response.data)
         assert data["success"] is False
         assert data["error"]["code"] == "MISSING_PARAMETER"
+
+    def test_batch_runs_calls_in_order(self, client):
+        """Test POST /batch runs each whitelisted call in order"""
+        mock_vv = get_vv_instance()
+        mock_vv.reset_mock()
+
+        response = client.post(
+            "/api/v1/batch",
+            json={"calls": [{"method": "EditTest", "args": ["test1.vsp"]}, {"method": "Maximize"}]},
+        )
+
+        assert response.status_code == 200
+        data = json.loads(response.data)["data"]
+        assert data["completed"] is True
+        assert [r["method"] for r in data["results"]] == ["EditTest", "Maximize"]
+        assert all(r["success"] and r["result"] is True for r in data["results"])
+        mock_vv.EditTest.assert_called_once_with("test1.vsp")
+        mock_vv.Maximize.assert_called_once_with()
+
+    def test_batch_stops_at_first_failure(self, client):
+        """Test POST /batch returns an error with the results so far and skips the rest"""
+        mock_vv = get_vv_instance()
+        mock_vv.reset_mock()
+        mock_vv.Maximize.side_effect = RuntimeError("window busy")
+
+        response = client.post(
+            "/api/v1/batch", json={"calls": [{"method": "Minimize"}, {"method": "Maximize"}, {"method": "Activate"}]}
+        )
+
+        assert response.status_code == 500
+        data = json.loads(response.data)
+        assert data["success"] is False
+        assert data["error"]["code"] == "COM_ERROR"
+        details = data["error"]["details"]
+        assert details["completed"] is False
+        assert details["results"] == [
+            {"method": "Minimize", "success": True, "result": True},
+            {"method": "Maximize", "success": False, "error": "window busy"},
+        ]
+        mock_vv.Activate.assert_not_called()
+
+    def test_batch_vibrationview_error_is_classified(self, client):
+        """Test POST /batch maps a known VibrationVIEW error to its code, description and status"""
+        mock_vv = get_vv_instance()
+        mock_vv.reset_mock()
+        mock_vv.EditTest.side_effect = Exception(
+            DISP_E_EXCEPTION,
+            "Exception occurred.",
+            (0, None, "Test file missing", None, 0, VVIEW_E_TEST_NOT_FOUND),
+            None,
+        )
+
+        response = client.post("/api/v1/batch", json={"calls": [{"method": "EditTest", "args": ["missing.vsp"]}]})
+
+        assert response.status_code == 404
+        data = json.loads(response.data)
+        assert data["error"]["code"] == "TEST_NOT_FOUND"
+        assert data["error"]["details"]["results"] == [
+            {"method": "EditTest", "success": False, "error": "Test file missing", "error_code": "TEST_NOT_FOUND"}
+        ]
+
+    def test_batch_invalid_calls(self, client):
+        """Test POST /batch validates every call before running any"""
+        mock_vv = get_vv_instance()
+        mock_vv.reset_mock()
+
+        for body in (
+            {},
+            {"calls": []},
+            {"calls": [{"method": "Minimize"}, {"method": "Shutdown"}]},
+            {"calls": [{"method": "EditTest"}]},
+            {"calls": [{"method": "Minimize", "args": ["x"]}]},
+            {"calls": [{"method": "Minimize"}] * 33},
+        ):
+            response = client.post("/api/v1/batch", json=body)
+            assert response.status_code == 400, body
+
+        mock_vv.Minimize.assert_not_called()
@@ -82,3 +82,26 @@ class TestHardwareSupportsChannelIndexing:
         data = response.get_json()
         assert data["success"] is False
         assert data["error"]["code"] == "MISSING_PARAMETER"
+
+
+class TestSoftwareVersionCache:
+    """GetSoftwareVersion() is called once per VibrationVIEW instance."""
+
+    def test_software_version_read_once_per_instance(self, client):
+        c, mock_vv = client
+        first = c.get("/api/v1/getsoftwareversion").get_json()
+        second = c.get("/api/v1/getsoftwareversion").get_json()
+
+        assert first["data"]["result"] == second["data"]["result"] == mock_vv._software_version
+        assert len(mock_vv.get_method_calls("GetSoftwareVersion")) == 1
+
+    def test_new_instance_reads_version_again(self, client):
+        c, mock_vv = client
+        c.get("/api/v1/getsoftwareversion")
+
+        replacement = MockVibrationVIEW()
+        replacement._software_version = "2026.1.0"
+        set_vv_instance(replacement)
+        response = c.get("/api/v1/getsoftwareversion")
+
+        assert response.get_json()["data"]["result"] == "2026.1.0"
@@ -173,3 +173,43 @@ class TestDocumentationContent:
                 failed_modules.append(module_name)
 
         assert len(failed_modules) == 0, f"The following modules are missing docs endpoints: {failed_modules}"
+
+
+# Modules whose documentation is pre-serialized and served with an ETag
+CACHED_DOC_MODULES = [
+    "basic_control",
+    "data_retrieval",
+    "gui_control",
+    "hardware_config",
+    "vectors_legacy",
+    "vector_enums",
+]
+
+
+class TestCachedDocumentation:
+    """Static documentation is served from pre-serialized bytes with an ETag"""
+
+    @pytest.mark.parametrize("module_name", CACHED_DOC_MODULES)
+    def test_docs_have_etag(self, client, module_name):
+        response = client.get(f"/api/v1/docs/{module_name}")
+
+        assert response.status_code == 200
+        assert response.headers.get("ETag")
+        assert response.mimetype == "application/json"
+
+    @pytest.mark.parametrize("module_name", CACHED_DOC_MODULES)
+    def test_docs_if_none_match_returns_304(self, client, module_name):
+        etag = client.get(f"/api/v1/docs/{module_name}").headers["ETag"]
+
+        response = client.get(f"/api/v1/docs/{module_name}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+
+    @pytest.mark.parametrize("module_name", CACHED_DOC_MODULES)
+    def test_docs_body_is_stable(self, client, module_name):
+        first = client.get(f"/api/v1/docs/{module_name}")
+        second = client.get(f"/api/v1/docs/{module_name}")
+
+        assert first.data == second.data
+        assert first.headers["ETag"] == second.headers["ETag"]
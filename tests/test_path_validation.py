@@ -91,6 +91,22 @@ class TestPathValidation:
         # Should return normalized path
         assert result == str(normalize_path(valid_path))
 
+    def test_authorized_directories_resolved_once(self, tmp_path):
+        """Test that authorized directories are not re-resolved on every validation"""
+        with patch.object(Config, "REPORT_FOLDER", str(tmp_path)):
+            assert is_path_within_authorized_directories(tmp_path / "first.pdf")
+            with patch("utils.path_validator.normalize_path", wraps=normalize_path) as mock_normalize:
+                assert is_path_within_authorized_directories(tmp_path / "second.pdf")
+        resolved = {str(call.args[0]) for call in mock_normalize.call_args_list}
+        assert resolved == {str(tmp_path / "second.pdf")}
+
+    def test_authorized_directories_follow_config_changes(self, tmp_path):
+        """Test that a changed directory configuration is picked up"""
+        path = str(tmp_path / "elsewhere" / "test.pdf")
+        assert not is_path_within_authorized_directories(path)
+        with patch.object(Config, "REPORT_FOLDER", str(tmp_path / "elsewhere")):
+            assert is_path_within_authorized_directories(path)
+
     def test_validate_file_path_empty(self, mock_config):
         """Test validation with empty path"""
         with pytest.raises(PathValidationError, match="Empty file path not allowed"):
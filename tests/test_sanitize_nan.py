@@ -95,3 +95,52 @@ class TestNaNSafeJSONProvider:
             response = jsonify({"value": float("inf")})
             data = response.get_json()
             assert data["value"] is None
+
+    def test_tuples_serialized_as_arrays(self, app):
+        """Tuples returned by COM calls serialize as JSON arrays."""
+        from flask import jsonify
+
+        with app.app_context():
+            response = jsonify({"rows": (("1", "Sine"), ("2", float("nan")))})
+            assert response.get_json() == {"rows": [["1", "Sine"], ["2", None]]}
+
+    def test_non_ascii_output_is_escaped(self, app):
+        """Non-ASCII text is escaped on the orjson output, matching the stdlib encoder."""
+        import json
+        from unittest.mock import patch
+
+        from flask import jsonify
+        from flask.json.provider import DefaultJSONProvider
+
+        payload = {"unit": "m/s²", "label": "°C", "emoji": "\U0001f600", "quote": 'a"b\\c'}
+        with app.app_context():
+            with patch.object(DefaultJSONProvider, "dumps", side_effect=AssertionError("stdlib fallback used")):
+                response = jsonify(payload)
+
+        assert response.data.rstrip(b"\n") == json.dumps(payload, separators=(",", ":")).encode("ascii")
+        assert response.get_json() == payload
+
+    def test_wide_integer_falls_back_to_stdlib(self, app):
+        """Integers orjson cannot encode still serialize."""
+        from flask import jsonify
+
+        with app.app_context():
+            response = jsonify({"value": 2**70, "nan": float("nan")})
+            assert response.get_json() == {"value": 2**70, "nan": None}
+
+    def test_non_string_keys(self, app):
+        """Integer dictionary keys are written as strings, as with json.dumps."""
+        from flask import jsonify
+
+        with app.app_context():
+            response = jsonify({1: "a", 2: "b"})
+            assert response.get_json() == {"1": "a", "2": "b"}
+
+    def test_compact_unsorted_output_in_debug(self, app):
+        """Responses keep handler key order and are not indented under debug."""
+        from flask import jsonify
+
+        app.debug = True
+        with app.app_context():
+            response = jsonify({"b": 1, "a": [1, 2]})
+            assert response.data == b'{"b":1,"a":[1,2]}\n'
@@ -10,9 +10,14 @@ application code. These tests verify that oversized requests return a
 JSON 413 response regardless of which endpoint is targeted.
 """
 
+import io
+import os
+from unittest.mock import patch
+
 import pytest
 
 from app import get_vv_instance
+from config import Config
 
 
 class TestUploadSizeLimit:
@@ -93,3 +98,47 @@ class TestUploadSizeLimit:
             assert response.status_code == 413
         finally:
             app.config["MAX_CONTENT_LENGTH"] = original_limit
+
+
+class TestChunkedUpload:
+    """Raw binary uploads sent with Transfer-Encoding: chunked (no Content-Length)."""
+
+    @pytest.fixture(autouse=True)
+    def _setup_mock(self, client):
+        self.mock_instance = get_vv_instance()
+
+    @staticmethod
+    def _chunked_put(client, url, body):
+        return client.put(
+            url,
+            input_stream=io.BytesIO(body),
+            content_type="application/octet-stream",
+            headers={"Transfer-Encoding": "chunked"},
+            environ_overrides={"wsgi.input_terminated": True},
+        )
+
+    def test_chunked_body_is_saved_and_opened(self, client, tmp_path):
+        body = b"profile bytes" * 1000
+
+        with patch.object(Config, "PROFILE_FOLDER", str(tmp_path)):
+            response = self._chunked_put(client, "/api/v1/opentest?filename=chunked.vsp", body)
+
+        assert response.status_code == 200
+        saved_path = tmp_path / "Uploads" / "chunked.vsp"
+        assert saved_path.read_bytes() == body
+        self.mock_instance.OpenTest.assert_called_once_with(str(saved_path))
+
+    def test_oversized_chunked_body_returns_413(self, app, client, tmp_path):
+        original_limit = app.config.get("MAX_CONTENT_LENGTH")
+        app.config["MAX_CONTENT_LENGTH"] = 1024
+
+        try:
+            with patch.object(Config, "PROFILE_FOLDER", str(tmp_path)):
+                response = self._chunked_put(client, "/api/v1/opentest?filename=big.vsp", b"x" * 4096)
+        finally:
+            app.config["MAX_CONTENT_LENGTH"] = original_limit
+
+        assert response.status_code == 413
+        assert response.get_json()["success"] is False
+        assert os.listdir(tmp_path / "Uploads") == []
+        self.mock_instance.OpenTest.assert_not_called()
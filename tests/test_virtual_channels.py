@@ -8,8 +8,6 @@ Tests for virtual channels route APIError cases
 
 import json
 
-from app import get_vv_instance
-
 
 class TestVirtualChannels:
     def test_importvirtualchannels_missing_filename(self, client):
@@ -7,8 +7,9 @@ Path validation utilities for securing file operations
 Ensures file paths are restricted to authorized directories
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Union
+from typing import List, Tuple, Union
 
 from config import Config
 
@@ -55,6 +56,16 @@ def normalize_path(path: Union[str, Path]) -> Path:
     return Path(path).resolve()
 
 
+@lru_cache(maxsize=8)
+def _normalized_directories(directories: Tuple[str, ...]) -> Tuple[Path, ...]:
+    """
+    Resolve authorized directories once per distinct configuration
+
+    Keyed by the directory tuple so a changed Config is picked up on the next call.
+    """
+    return tuple(normalize_path(directory) for directory in directories)
+
+
 def is_path_within_authorized_directories(file_path: Union[str, Path]) -> bool:
     """
     Check if a file path is within any of the authorized directories
@@ -67,10 +78,9 @@ def is_path_within_authorized_directories(file_path: Union[str, Path]) -> bool:
     """
     try:
         normalized_path = normalize_path(file_path)
-        authorized_dirs = get_authorized_directories()
+        authorized_dirs = _normalized_directories(tuple(get_authorized_directories()))
 
-        for auth_dir in authorized_dirs:
-            auth_dir_normalized = normalize_path(auth_dir)
+        for auth_dir_normalized in authorized_dirs:
             try:
                 # Check if the file path is within the authorized directory
                 normalized_path.relative_to(auth_dir_normalized)
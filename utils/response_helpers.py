@@ -6,9 +6,16 @@
 Response formatting utilities for consistent API responses
 """
 
+import gzip
+import hashlib
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+import orjson
+from flask import Response, current_app, jsonify, request
+
+from utils.vv_error_codes import get_error_info
+
 
 def success_response(data: Any = None, message: str = "Operation completed successfully") -> Dict:
     """
@@ -65,8 +72,6 @@ def com_error_response(com_exception: Exception) -> Dict:
     Returns:
         Dict: Standardized COM error response
     """
-    from utils.vv_error_codes import get_error_info
-
     details: Dict[str, Any] = {
         "exception_type": type(com_exception).__name__,
         "com_hresult": getattr(com_exception, "hresult", None),
@@ -79,3 +84,62 @@ def com_error_response(com_exception: Exception) -> Dict:
     return error_response(
         message=f"VibrationVIEW COM Error: {str(com_exception)}", error_code="COM_ERROR", details=details
     )
+
+
+def cacheable_response(payload: Dict) -> Response:
+    """
+    jsonify ``payload`` and, when LABEL_CACHE_MAX_AGE is set, mark it cacheable
+
+    Intended for label/unit/length lookups that only change when a different
+    test is loaded, so clients may reuse them for a few seconds.
+
+    Args:
+        payload: Response dict (usually from success_response)
+
+    Returns:
+        Response: JSON response, with Cache-Control when caching is enabled
+    """
+    response = jsonify(payload)
+    max_age = current_app.config.get("LABEL_CACHE_MAX_AGE", 0)
+    if max_age > 0:
+        # private: responses are authenticated, so shared caches must not store them
+        response.cache_control.private = True
+        response.cache_control.max_age = max_age
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+class StaticJSONDocument:
+    """
+    A JSON payload that never changes at runtime (e.g. module documentation).
+
+    The payload is serialized and hashed once; ``response()`` then serves the
+    same bytes with a strong ETag and answers ``If-None-Match`` with 304.
+    When response compression is enabled, a gzip copy is built on first use
+    and served as-is to clients that accept it.
+    """
+
+    __slots__ = ("body", "etag", "_gzip_body")
+
+    def __init__(self, payload: Any) -> None:
+        self.body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        self.etag = hashlib.sha1(self.body, usedforsecurity=False).hexdigest()
+        self._gzip_body: Optional[bytes] = None
+
+    def _wants_gzip(self) -> bool:
+        min_size = current_app.config.get("GZIP_MIN_SIZE", 0)
+        return 0 < min_size <= len(self.body) and bool(request.accept_encodings["gzip"])
+
+    def response(self) -> Response:
+        """Build a (possibly 304) response for the current request"""
+        if self._wants_gzip():
+            if self._gzip_body is None:
+                self._gzip_body = gzip.compress(self.body, compresslevel=9)
+            response = Response(self._gzip_body, mimetype="application/json")
+            response.headers["Content-Encoding"] = "gzip"
+            response.set_etag(f"{self.etag}-gzip")
+        else:
+            response = Response(self.body, mimetype="application/json")
+            response.set_etag(self.etag)
+        response.vary.add("Accept-Encoding")
+        return response.make_conditional(request)
@@ -1,17 +1,21 @@
 import logging
 import os
 import re
+import shutil
 import sys
+import tempfile
 import threading
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import unquote
 
 from flask import request
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 
 from config import Config
 from utils.exceptions import APIError
+from utils.vv_manager import software_version_cached
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +32,7 @@ def get_system_info() -> Dict[str, Any]:
 def get_hardware_info(vv_instance: Any) -> Dict[str, Any]:
     """Return a dict of VibrationVIEW hardware and version info."""
     return {
-        "version": vv_instance.GetSoftwareVersion(),
+        "version": software_version_cached(vv_instance),
         "hardware_inputs": vv_instance.GetHardwareInputChannels(),
         "hardware_outputs": vv_instance.GetHardwareOutputChannels(),
         "serial_number": hex(int(vv_instance.GetHardwareSerialNumber()) & 0xFFFFFFFF),
@@ -36,28 +40,33 @@ def get_hardware_info(vv_instance: Any) -> Dict[str, Any]:
     }
 
 
-PROFILE_EXTENSIONS = {"vrp", "vrpj", "vasor", "vkp", "vkpj", "vsp", "vspj", "vdp", "vdpj", "vyp"}
+# Chunk size used when copying streamed upload bodies to disk
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
-DATA_EXTENSIONS = {"vrd", "vkd", "vsd", "vdd", "vyd"}  # v?d pattern
+PROFILE_EXTENSIONS = frozenset({"vrp", "vrpj", "vasor", "vkp", "vkpj", "vsp", "vspj", "vdp", "vdpj", "vyp"})
 
-TEMPLATE_EXTENSIONS = {
-    "vsyscheckt",
-    "vsinet",
-    "vrandomt",
-    "vsort",
-    "vrort",
-    "vsorort",
-    "vsost",
-    "vanalyzert",
-    "vshockt",
-    "vudtt",
-    "vsrst",
-    "vtransientt",
-}
+DATA_EXTENSIONS = frozenset({"vrd", "vkd", "vsd", "vdd", "vyd"})  # v?d pattern
 
-INPUTCONFIG_EXTENSIONS = {"vic", "vchan", "inputconfig"}
+TEMPLATE_EXTENSIONS = frozenset(
+    {
+        "vsyscheckt",
+        "vsinet",
+        "vrandomt",
+        "vsort",
+        "vrort",
+        "vsorort",
+        "vsost",
+        "vanalyzert",
+        "vshockt",
+        "vudtt",
+        "vsrst",
+        "vtransientt",
+    }
+)
 
-REPORT_EXTENSIONS = {"vvtemplate", "rtf", "txt", "xlsx", "xlsm", "xls", "csv", "html", "htm", "pdf"}
+INPUTCONFIG_EXTENSIONS = frozenset({"vic", "vchan", "inputconfig"})
+
+REPORT_EXTENSIONS = frozenset({"vvtemplate", "rtf", "txt", "xlsx", "xlsm", "xls", "csv", "html", "htm", "pdf"})
 
 ALLOWED_EXTENSIONS = (
     PROFILE_EXTENSIONS | DATA_EXTENSIONS | TEMPLATE_EXTENSIONS | INPUTCONFIG_EXTENSIONS | REPORT_EXTENSIONS
@@ -85,9 +94,14 @@ def get_folder_for_extension(filename_or_ext: str) -> str:
         return Config.VIBRATIONVIEW_FOLDER
 
 
-def handle_binary_upload(filename: str, binary_data: bytes, usetemporaryfile: bool = False) -> Dict:
+def handle_binary_upload(filename: str, binary_data: Union[bytes, IO[bytes]], usetemporaryfile: bool = False) -> Dict:
     """Save uploaded binary data to disk.
 
+    ``binary_data`` may be a bytes object or a readable binary stream. Streams
+    are copied to disk in ``UPLOAD_CHUNK_SIZE`` chunks so the body is never
+    held in memory as a whole. The file is published with ``os.replace`` once
+    fully written.
+
     Returns:
         dict with FilePath, Filename, and Size keys.
 
@@ -119,8 +133,20 @@ def handle_binary_upload(filename: str, binary_data: bytes, usetemporaryfile: bo
         raise APIError("File extension changed during sanitization", "UPLOAD_ERROR")
     file_path = os.path.join(temp_folder, safe_filename)
 
-    with open(file_path, "wb") as f:
-        f.write(binary_data)
+    # Write to a temporary file in the same folder and rename it into place, so
+    # a truncated or oversized body never leaves a partial file at file_path.
+    fd, temp_path = tempfile.mkstemp(dir=temp_folder, prefix=".upload_", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if isinstance(binary_data, (bytes, bytearray)):
+                f.write(binary_data)
+            else:
+                shutil.copyfileobj(binary_data, f, UPLOAD_CHUNK_SIZE)
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
 
     logger.info(f"Binary file saved: {file_path}")
 
@@ -214,8 +240,6 @@ def get_last_data_file(vv_instance: Any) -> str:
     Raises APIError(400) if no file is available.
     COM exceptions propagate to @handle_errors for proper classification.
     """
-    from utils.exceptions import APIError
-
     file_path = vv_instance.ReportField("LastDataFile")
     if not file_path:
         raise APIError(
@@ -275,20 +299,22 @@ def get_new_test_defaults_path() -> str:
 
 
 # Pre-computed lowercase default template filenames for performance
-DEFAULT_TEMPLATE_FILENAMES = {
-    "random.vrandomt",
-    "sine.vsinet",
-    "shock.vshockt",
-    "fdr.vfdrt",
-    "sor.vsort",
-    "sos.vsost",
-    "ror.vrort",
-    "sororor.vsorort",
-    "srs.vsrst",
-    "user-defined transient.vudtt",
-    "transient.vtransientt",
-    "analyzer.vanalyzert",
-}
+DEFAULT_TEMPLATE_FILENAMES = frozenset(
+    {
+        "random.vrandomt",
+        "sine.vsinet",
+        "shock.vshockt",
+        "fdr.vfdrt",
+        "sor.vsort",
+        "sos.vsost",
+        "ror.vrort",
+        "sororor.vsorort",
+        "srs.vsrst",
+        "user-defined transient.vudtt",
+        "transient.vtransientt",
+        "analyzer.vanalyzert",
+    }
+)
 
 
 def is_default_template_filename(filename: str) -> bool:
@@ -329,12 +355,16 @@ def is_valid_urn(value: Any) -> bool:
     return bool(URN_PATTERN.match(value.strip()))
 
 
-def detect_file_upload() -> Tuple[Optional[str], Optional[bytes], Optional[int]]:
+def detect_file_upload() -> Tuple[Optional[str], Optional[IO[bytes]], Optional[int]]:
     """
     Detect if the current request contains a file upload.
 
+    The body is not read here; the returned stream is consumed by
+    ``handle_binary_upload``. Werkzeug enforces MAX_CONTENT_LENGTH while the
+    stream is read, so oversized bodies still fail with 413.
+
     Returns:
-        tuple: (filename, binary_data, content_length) if file upload detected
+        tuple: (filename, stream, content_length) if file upload detected
         tuple: (None, None, None) if no file upload
 
     Raises:
@@ -342,23 +372,34 @@ def detect_file_upload() -> Tuple[Optional[str], Optional[bytes], Optional[int]]
 
     Supports:
         - multipart/form-data with any file field name
-        - Raw binary body with filename in query parameter
+        - Raw binary body with filename in query parameter, sent either with
+          Content-Length or with Transfer-Encoding: chunked
     """
     content_type = request.content_type or ""
 
+    # Debug messages use lazy %-formatting so nothing is built when DEBUG is off
     logger.debug(
-        f"detect_file_upload: method={request.method}, content_type={content_type}, "
-        f"content_length={request.content_length}, files={list(request.files.keys())}"
+        "detect_file_upload: method=%s, content_type=%s, content_length=%s",
+        request.method,
+        content_type,
+        request.content_length,
     )
 
-    # Check for multipart file upload (any field name)
-    has_multipart_file = len(request.files) > 0
+    # Reject a declared oversized body up front, as form parsing would have
+    max_length = request.max_content_length
+    if max_length is not None and (request.content_length or 0) > max_length:
+        raise RequestEntityTooLarge()
+
+    # Check for multipart file upload (any field name). request.files triggers
+    # form parsing, so only touch it when the body is actually multipart.
+    has_multipart_file = request.mimetype == "multipart/form-data" and len(request.files) > 0
+
+    # Chunked bodies (Transfer-Encoding: chunked) arrive without a Content-Length
+    has_body = bool(request.content_length) or "chunked" in request.headers.get("Transfer-Encoding", "").lower()
 
     # Check for raw binary upload (exclude json, form, multipart)
     is_binary_content_type = (
-        request.content_length
-        and request.content_length > 0
-        and not has_multipart_file
+        has_body
         and "multipart" not in content_type
         and "application/json" not in content_type
         and "application/x-www-form-urlencoded" not in content_type
@@ -369,25 +410,19 @@ def detect_file_upload() -> Tuple[Optional[str], Optional[bytes], Optional[int]]
         file_field = next(iter(request.files))
         uploaded_file = request.files[file_field]
         filename = uploaded_file.filename
-        binary_data = uploaded_file.read()
-        content_length: Optional[int] = len(binary_data)
+        content_length: Optional[int] = uploaded_file.content_length or None
         logger.debug(
-            f"detect_file_upload: multipart file field={file_field}, filename={filename}, size={content_length}"
+            "detect_file_upload: multipart file field=%s, filename=%s, size=%s", file_field, filename, content_length
         )
 
         if not filename:
             raise APIError("Multipart file field has no filename", "UPLOAD_ERROR")
 
-        return (filename, binary_data, content_length)
+        return (filename, uploaded_file.stream, content_length)
 
     elif is_binary_content_type:
         # Raw binary mode - get filename from query parameter
-        filename = request.args.get("filename")
-
-        if filename is None:
-            query_string = request.query_string.decode("utf-8")
-            if query_string:
-                filename = unquote(query_string)
+        filename = get_filename_from_request()
 
         if not filename:
             raise APIError(
@@ -395,15 +430,38 @@ def detect_file_upload() -> Tuple[Optional[str], Optional[bytes], Optional[int]]
             )
 
         content_length = request.content_length
-        binary_data = request.get_data()
-        logger.debug(f"detect_file_upload: raw binary filename={filename}, size={content_length}")
+        logger.debug("detect_file_upload: raw binary filename=%s, size=%s", filename, content_length)
 
-        return (filename, binary_data, content_length)
+        return (filename, request.stream, content_length)
 
     # No file upload detected
     return (None, None, None)
 
 
+def get_query_param_string(name: str) -> Optional[str]:
+    """
+    Get a string parameter given either by name or as the unnamed query string.
+
+    The named form (``?name=value``) takes precedence; otherwise the whole
+    query string is URL-decoded and used as the value (``?value``). A query
+    string without ``=`` can only be the unnamed form, so ``request.args`` is
+    not parsed for it.
+
+    Returns:
+        str: The parameter value, or None if the query string is empty
+    """
+    query_string = request.query_string
+    if not query_string:
+        return None
+
+    if b"=" in query_string:
+        value = request.args.get(name)
+        if value is not None:
+            return value
+
+    return unquote(query_string.decode("utf-8"))
+
+
 def get_filename_from_request() -> Optional[str]:
     """
     Extract filename from request query parameters.
@@ -411,11 +469,4 @@ def get_filename_from_request() -> Optional[str]:
     Returns:
         str: The filename, or None if not found
     """
-    filename = request.args.get("filename")
-
-    if filename is None:
-        query_string = request.query_string.decode("utf-8")
-        if query_string:
-            filename = unquote(query_string)
-
-    return filename
+    return get_query_param_string("filename")
@@ -7,9 +7,12 @@ VibrationVIEW manager — imports the singleton from utils.vv_singleton
 """
 
 import logging
+import threading
+import time
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Optional
 
+from config import Config
 from utils.vv_singleton import get_vv_instance, reset_vv_instance
 
 logger = logging.getLogger(__name__)
@@ -59,3 +62,64 @@ def with_vibrationview(func: Callable) -> Callable:
         return func(vv, *args, **kwargs)
 
     return wrapper
+
+
+# Most recent ListOpenTests() result, tied to the instance that produced it
+_open_tests_cache: Dict[str, Any] = {"instance": None, "time": 0.0, "value": None}
+_open_tests_lock = threading.Lock()
+
+
+def list_open_tests_cached(vv_instance: Any, ttl: Optional[float] = None) -> Any:
+    """
+    Return ListOpenTests(), reusing a result younger than ``ttl`` seconds.
+
+    Used by the read-only /listopentests endpoint so polling clients do not
+    marshal the full open-tests array on every request. Tabs opened or closed
+    in the VibrationVIEW UI are not seen until the result expires, so never
+    pass a cached tab index to CloseTab(). Call ``invalidate_open_tests_cache``
+    after any operation that opens or closes a test.
+    """
+    if ttl is None:
+        ttl = Config.OPEN_TESTS_CACHE_TTL
+
+    now = time.monotonic()
+    with _open_tests_lock:
+        if _open_tests_cache["instance"] is vv_instance and now - _open_tests_cache["time"] < ttl:
+            return _open_tests_cache["value"]
+
+    value = vv_instance.ListOpenTests()
+
+    with _open_tests_lock:
+        _open_tests_cache.update(instance=vv_instance, time=now, value=value)
+    return value
+
+
+def invalidate_open_tests_cache() -> None:
+    """Discard the cached ListOpenTests() result"""
+    with _open_tests_lock:
+        _open_tests_cache.update(instance=None, time=0.0, value=None)
+
+
+# GetSoftwareVersion() result for the instance that produced it. The version
+# cannot change while that VibrationVIEW process is running; a reconnect
+# creates a new instance, which misses the cache.
+_software_version_cache: Dict[str, Any] = {"instance": None, "value": None}
+_software_version_lock = threading.Lock()
+
+
+def software_version_cached(vv_instance: Any) -> Any:
+    """
+    Return GetSoftwareVersion(), calling COM only once per instance.
+
+    Hardware channel counts and serial number are not cached this way: the
+    hardware can be reconfigured while VibrationVIEW stays running.
+    """
+    with _software_version_lock:
+        if _software_version_cache["instance"] is vv_instance:
+            return _software_version_cache["value"]
+
+    value = vv_instance.GetSoftwareVersion()
+
+    with _software_version_lock:
+        _software_version_cache.update(instance=vv_instance, value=value)
+    return value